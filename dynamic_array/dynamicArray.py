@@ -23,14 +23,26 @@ start with 16, or if starting number is greater, use power of 2 - 16, 32, 64, 12
  - prepend(item) - can use insert above at index 0
  - pop() - remove from end, return value
  - delete(index) - delete item at index, shifting all trailing elements left
- - remove(item) - looks for value and removes index holding it (even if in multiple places)
+ - remove(item) - looks for value and removes index holding it (even if in multiple places) -> remove_all(item)
  - find(item) - looks for value and returns first index with that value, -1 if not found
+ - find_all(item), count(item) - every index / number of occurrences
+ - remove_all(item), filter_inplace(predicate) - single compacting pass over the array
+   (typed arrays use NumPy vectorized comparisons when it is installed)
+ - extend(iterable) - push every item of iterable
+ - insert_many(index, iterable) - inserts a batch of items at index with one block shift
+ - delete_range(start, stop) - deletes items in [start, stop) with one block shift
+ - arr[start:stop:step] - zero-copy ArrayView sharing arr's storage; .copy() to detach
+ - DynamicArray(typecode='d'/'q'/'i'/...) - typed mode storing raw machine values,
+   exported zero-copy through memoryview / numpy.asarray
  - resize(new_capacity) // private function
     when you reach capacity, resize to double the size
     when popping an item, if size is 1/4 of capacity, resize to half
+    (both configurable through a growth policy: GeometricGrowth(factor, shrink_at), FixedStepGrowth(step))
+ - reserve(n), shrink_to_fit() - pre-allocate / release capacity
+ - telemetry() - no. of resizes, bytes copied, peak capacity
 Time
 O(1) to add/remove at end (amortized for allocations for more space), index, or update
-O(n) to insert/remove elsewhere
+O(n) to insert/remove elsewhere (done as a single memmove of the trailing block)
 
 Space
 contiguous in memory, so proximity helps performance
@@ -42,15 +54,156 @@ In Python,
 - list.append() & list.pop() take O(1), amortized
 """
 import ctypes 
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # typed arrays fall back to plain Python passes
+    np = None
+
+# Every slot of the py_object buffer is a raw PyObject* pointer, so whole
+# blocks of slots can be shifted with one memmove. The array owns a strong
+# reference to each stored element, which is taken/released explicitly here
+# (ctypes' own per-index bookkeeping does not survive a memmove).
+_incref = ctypes.pythonapi.Py_IncRef
+_incref.argtypes = [ctypes.py_object]
+_incref.restype = None
+_decref = ctypes.pythonapi.Py_DecRef
+_decref.argtypes = [ctypes.py_object]
+_decref.restype = None
+
+# typecode (as in the array module) -> ctypes type of a raw machine slot
+TYPECODES = {
+    'b': ctypes.c_byte, 'B': ctypes.c_ubyte,
+    'h': ctypes.c_short, 'H': ctypes.c_ushort,
+    'i': ctypes.c_int, 'I': ctypes.c_uint,
+    'l': ctypes.c_long, 'L': ctypes.c_ulong,
+    'q': ctypes.c_longlong, 'Q': ctypes.c_ulonglong,
+    'f': ctypes.c_float, 'd': ctypes.c_double,
+}
+
+############## Growth Policies ################
+class GeometricGrowth(object):
+    """
+    Multiply the capacity by factor when full (2 -> doubling, 1.5 -> like many
+    C++ vectors). Shrink by the same factor once the size falls to shrink_at
+    of the capacity; the gap between "full" and shrink_at is the hysteresis band
+    that stops alternating push/pop from resizing every call.
+    shrink_at=None never shrinks.
+    """
+    def __init__(self, factor=2, shrink_at=0.25):
+        if factor <= 1:
+            raise ValueError("factor must be greater than 1")
+        if shrink_at is not None and not 0 < shrink_at < 1/factor:
+            raise ValueError("shrink_at must be in (0, 1/factor) to keep a hysteresis band")
+        self.factor = factor
+        self.shrink_at = shrink_at
+
+    def grow(self, capacity, needed):
+        """
+        Returns the new capacity (>= needed) for an array that must hold needed items
+        """
+        new_cap = capacity
+        while new_cap < needed:
+            new_cap = max(new_cap+1, int(new_cap*self.factor))
+        return new_cap
+
+    def shrink(self, capacity, n):
+        """
+        Returns the capacity an array of n items should shrink to (or capacity to keep it)
+        """
+        if self.shrink_at is None or n > capacity*self.shrink_at:
+            return capacity
+        return max(1, n, int(capacity/self.factor))
+
+class FixedStepGrowth(object):
+    """
+    Add step slots when full; give one step back once two steps are unused.
+    Bounded slack (at most 2*step) at the price of O(n/step) copies per n appends.
+    """
+    def __init__(self, step=1024, shrink=True):
+        if step < 1:
+            raise ValueError("step must be positive")
+        self.step = step
+        self.shrink_enabled = shrink
+
+    def grow(self, capacity, needed):
+        """
+        Returns the new capacity (>= needed) for an array that must hold needed items
+        """
+        if needed <= capacity:
+            return capacity
+        return capacity + self.step * -(-(needed - capacity) // self.step)
+
+    def shrink(self, capacity, n):
+        """
+        Returns the capacity an array of n items should shrink to (or capacity to keep it)
+        """
+        if not self.shrink_enabled or n > capacity - 2*self.step:
+            return capacity
+        return max(1, capacity - self.step)
   
 class DynamicArray(object): 
     ''' 
     DYNAMIC ARRAY CLASS (Similar to Python List) 
+
+    With typecode=None (default) the slots hold Python objects.
+    With a typecode such as 'd', 'q' or 'i' the slots hold raw machine values
+    stored contiguously (like the array module), and the occupied part can be
+    exported through the buffer protocol without copying.
+
+    growth decides how capacity grows and shrinks (default GeometricGrowth():
+    double when full, halve at 1/4 full).
     '''
-    def __init__(self):
+    def __init__(self, typecode=None, growth=None):
+        if typecode is not None and typecode not in TYPECODES:
+            raise ValueError(f"bad typecode '{typecode}', must be one of {''.join(TYPECODES)}")
+        self.typecode = typecode
+        self._ctype = ctypes.py_object if typecode is None else TYPECODES[typecode]
+        self.itemsize = ctypes.sizeof(self._ctype)
         self.n = 0 # acctual number of elements
         self.capacity = 1 # default capacity
-        self.arr = self.make_array(self.capacity)
+        self._set_buffer(self.make_array(self.capacity))
+        self._init_growth(growth)
+
+    def __del__(self):
+        """
+        Release the references held by the occupied slots
+        """
+        if getattr(self, "n", 0):
+            self._release(0, self.n)
+
+    def __buffer__(self, flags):
+        """
+        Buffer protocol (Python 3.12+): memoryview(arr) of the occupied slots
+        """
+        return self.as_memoryview()
+
+    @property
+    def __array_interface__(self):
+        """
+        NumPy array interface, so numpy.asarray(arr) shares the buffer
+        """
+        mv = self.as_memoryview()
+        if self.typecode in 'fd':
+            kind = 'f'
+        elif self.typecode.islower():
+            kind = 'i'
+        else:
+            kind = 'u'
+        order = '<' if sys.byteorder == 'little' else '>'
+        return {'shape': (self.n,), 'typestr': f'{order}{kind}{self.itemsize}',
+                'data': mv, 'version': 3}
+
+    def as_memoryview(self):
+        """
+        Returns a zero-copy memoryview over the n occupied slots (typed mode only).
+        The view keeps the current buffer alive; after a resize it no longer
+        reflects the array.
+        """
+        if self.typecode is None:
+            raise TypeError("buffer export requires a typed array")
+        return memoryview(self.arr).cast('B')[:self.n*self.itemsize].cast(self.typecode)
           
     def __len__(self): 
         """ 
@@ -60,11 +213,13 @@ class DynamicArray(object):
 
     def __getitem__(self, k): 
         """ 
-        Return element at index k 
+        Return element at index k, or a zero-copy ArrayView for a slice
         """ 
+        if isinstance(k, slice):
+            return ArrayView(self, range(self.n)[k])
         # check if k is valid
-        if k > self.n or k < 0:
-            return IndexError("k is out of bounds")
+        if k >= self.n or k < 0:
+            raise IndexError("k is out of bounds")
         return self.arr[k] # otherwise, return the item
     
     def __str__(self):
@@ -79,12 +234,17 @@ class DynamicArray(object):
         """ 
         Add element to end of the array 
         """
-        # if the array is full, double the capacity
-        if self.n==self.capacity:
-            self._resize(2*self.capacity)
+        # if the array is full, grow the capacity
+        self._grow_to(self.n+1)
         # set index n entry to element and increment n
-        self.arr[self.n] = ele
+        self._store(self.n, ele)
         self.n+=1  
+
+    def extend(self, iterable):
+        """
+        Add every element of iterable to the end of the array
+        """
+        self.insert_many(self.n, iterable)
   
     def insert_at(self,item,index):
         """ 
@@ -96,14 +256,32 @@ class DynamicArray(object):
             return
 
         # if the array is full, resize
-        if self.n==self.capacity:
-            self._resize(2*self.capacity)
-        # copy elements after the index into the new array
-        for i in range(self.n-1, index-1, -1):
-            self.arr[i+1] = self.arr[i]
+        self._grow_to(self.n+1)
+        # shift elements after the index one slot to the right (one block move)
+        self._move(index+1, index, self.n-index)
         # then insert the item at index
-        self.arr[index] = item
+        self._store(index, item)
         self.n+=1
+
+    def insert_many(self, index, iterable):
+        """
+        This function inserts all items of iterable starting at the specified index.
+        """
+        # check if the index is valid
+        if self.n<index or index<0:
+            print("index is out of bounds")
+            return
+        items = list(iterable)
+        k = len(items)
+        if k==0:
+            return
+
+        # grow until the batch fits
+        self._grow_to(self.n+k)
+        # open a gap of k slots at index, then fill it
+        self._move(index+k, index, self.n-index)
+        self._store_many(index, items)
+        self.n+=k
     
     def prepend(self, item):
         """
@@ -118,8 +296,9 @@ class DynamicArray(object):
         if self.n==0:
             print("Empty array, deletion is not possible")
             return
-        self.arr[self.n-1]=0 # zero-out
+        self._release(self.n-1, self.n) # zero-out
         self.n-=1 # decrement
+        self._shrink_if_sparse()
 
     def pop(self):
         """
@@ -128,12 +307,11 @@ class DynamicArray(object):
         if self.n==0:
             print("Empty array, pop is not possible")
             return
-        # when popping an item, if size is 1/4 of capacity, resize to half
-        if self.n <= self.capacity/4:
-            self._resize(int(self.capacity/2))
         temp = self.arr[self.n-1]  # store in a temporary var
-        self.arr[self.n-1] = 0
+        self._release(self.n-1, self.n)
         self.n-=1
+        # e.g. when size drops to 1/4 of capacity, resize to half
+        self._shrink_if_sparse()
         return temp
       
     def remove_at(self,index): 
@@ -146,26 +324,147 @@ class DynamicArray(object):
             return
         if self.n-1<index or index<0:
             return IndexError("invalid index")
-        for i in range(index+1, self.n):
-            self.arr[i-1] = self.arr[i]
-        self.arr[self.n-1] = 0  # reset the last element to 0
-        self.n-=1  # decrement 1
+        self.delete_range(index, index+1)
+
+    def delete_range(self, start, stop):
+        """
+        This function deletes items in [start, stop), shifting trailing elements left.
+        """
+        if start<0 or stop>self.n or stop<start:
+            print("invalid range")
+            return
+        k = stop-start
+        if k==0:
+            return
+        self._release(start, stop)
+        # close the gap with one block move and clear the vacated tail slots
+        self._move(start, stop, self.n-stop)
+        ctypes.memset(self._addr(self.n-k), 0, k*self.itemsize)
+        self.n-=k
+        self._shrink_if_sparse()
+
+    def reserve(self, n):
+        """
+        Makes room for at least n items without further resizes
+        """
+        if n > self.capacity:
+            self._resize(n)
+
+    def shrink_to_fit(self):
+        """
+        Releases unused capacity
+        """
+        if self.capacity > max(self.n, 1):
+            self._resize(max(self.n, 1))
+
+    def telemetry(self):
+        """
+        Returns allocation counters: resizes, bytes_copied, peak_capacity and current capacity
+        """
+        return {'resizes': self.resizes, 'bytes_copied': self.bytes_copied,
+                'peak_capacity': self.peak_capacity, 'capacity': self.capacity}
+
+    def _init_growth(self, growth):
+        """
+        Sets the growth policy and zeroes the allocation counters
+        """
+        self.growth = GeometricGrowth() if growth is None else growth
+        self.resizes = 0
+        self.bytes_copied = 0
+        self.peak_capacity = self.capacity
+
+    def _grow_to(self, needed):
+        """
+        Resizes (following the growth policy) if needed items do not fit
+        """
+        if needed > self.capacity:
+            self._resize(self.growth.grow(self.capacity, needed))
+
+    def _shrink_if_sparse(self):
+        """
+        Resizes down if the growth policy says the array is too sparse
+        """
+        new_cap = self.growth.shrink(self.capacity, self.n)
+        if new_cap < self.capacity:
+            self._resize(new_cap)
+
+    def _record_resize(self, new_cap, copied):
+        """
+        Updates the allocation counters for a resize that copied copied bytes
+        """
+        self.resizes += 1
+        self.bytes_copied += copied
+        self.peak_capacity = max(self.peak_capacity, new_cap)
           
     def _resize(self, new_cap): 
         """ 
         Resize internal array to capacity new_cap 
         """
         temp = self.make_array(new_cap)  # create bigger array
-        for i in range(self.n):
-            temp[i] = self.arr[i]  # copy over all existing values
-        self.arr = temp  # reset the reference
+        # copy over all existing pointers; ownership moves with them
+        ctypes.memmove(temp, self.arr, self.n*self.itemsize)
+        self._set_buffer(temp)  # reset the reference
+        self._record_resize(new_cap, self.n*self.itemsize)
         self.capacity = new_cap
+
+    def _set_buffer(self, arr):
+        """
+        Use arr as the backing buffer, with a raw-pointer view for writes
+        """
+        self.arr = arr
+        if self.typecode is None:
+            self._ptrs = (ctypes.c_void_p * len(arr)).from_buffer(arr)
+
+    def _addr(self, index):
+        """
+        Returns the memory address of slot index
+        """
+        return ctypes.addressof(self.arr) + index*self.itemsize
+
+    def _move(self, dst, src, count):
+        """
+        Moves count slots starting at src to dst (ranges may overlap)
+        """
+        if count > 0 and dst != src:
+            ctypes.memmove(self._addr(dst), self._addr(src), count*self.itemsize)
+
+    def _store(self, index, ele):
+        """
+        Writes ele into an empty slot, taking a reference to it
+        """
+        if self.typecode is not None:
+            self.arr[index] = ele
+            return
+        _incref(ele)
+        self._ptrs[index] = id(ele)
+
+    def _store_many(self, index, items):
+        """
+        Writes items into consecutive empty slots starting at index
+        """
+        if self.typecode is not None:
+            self.arr[index:index+len(items)] = items
+            return
+        for item in items:
+            _incref(item)
+        self._ptrs[index:index+len(items)] = [id(item) for item in items]
+
+    def _release(self, start, stop):
+        """
+        Drops the references held by slots [start, stop) and empties them
+        """
+        if self.typecode is not None:
+            return  # raw values own nothing
+        items = self.arr[start:stop]
+        self._ptrs[start:stop] = [None] * (stop-start)
+        for item in items:
+            _decref(item)
           
     def make_array(self, new_cap): 
         """ 
         Returns a new array with new_cap capacity 
         """
-        return (new_cap * ctypes.py_object)()
+        return (new_cap * self._ctype)()
 
     def find(self, item):
         # return the first known index
@@ -174,6 +473,126 @@ class DynamicArray(object):
                 return i 
         return -1
 
+    def find_all(self, item):
+        """
+        Returns the list of every index holding item
+        """
+        if self.typecode is not None and np is not None:
+            return np.flatnonzero(np.asarray(self) == item).tolist()
+        return [i for i, x in enumerate(self.arr[:self.n]) if x == item]
+
+    def count(self, item):
+        """
+        Returns the number of occurrences of item
+        """
+        if self.typecode is not None and np is not None:
+            return int(np.count_nonzero(np.asarray(self) == item))
+        return self.arr[:self.n].count(item)
+
+    def remove_all(self, item):
+        """
+        Removes every occurrence of item in one compacting pass; returns how many were removed
+        """
+        if self.typecode is not None and np is not None:
+            values = np.asarray(self)
+            kept = values[values != item]  # copy of the survivors
+            k = len(kept)
+            values[:k] = kept
+            del values  # release the buffer export before the size changes
+            removed = self.n - k
+            self.n = k
+            self._shrink_if_sparse()
+            return removed
+        return self.filter_inplace(lambda x: x != item)
+
+    def filter_inplace(self, predicate):
+        """
+        Keeps only the items for which predicate(item) is true, preserving order,
+        in one compacting pass; returns how many were removed
+        """
+        items = self.arr[:self.n]  # holds its own reference to every element
+        keep = [x for x in items if predicate(x)]
+        k = len(keep)
+        if self.typecode is None:
+            self._release(0, self.n)
+            self._store_many(0, keep)
+        else:
+            self.arr[:k] = keep
+        removed = self.n - k
+        self.n = k
+        self._shrink_if_sparse()
+        return removed
+
+class ArrayView(object):
+    """
+    Lightweight window over a DynamicArray (or a subclass) that shares its storage.
+
+    The view holds the parent and a range of parent indices (start, stop, step),
+    so creating or re-slicing it allocates no element storage. Reads go to the
+    parent's current buffer, so later writes to the parent are visible through
+    the view. Use copy() for an independent DynamicArray.
+    """
+    def __init__(self, parent, indices):
+        self.parent = parent
+        self.indices = indices  # range of parent indices
+
+    def __len__(self):
+        """
+        Return number of elements in the view
+        """
+        return len(self.indices)
+
+    def __getitem__(self, k):
+        """
+        Return element at index k of the view, or a narrower view for a slice
+        """
+        if isinstance(k, slice):
+            return ArrayView(self.parent, self.indices[k])
+        # check if k is valid
+        if k >= len(self.indices) or k < 0:
+            raise IndexError("k is out of bounds")
+        return self.parent[self.indices[k]]
+
+    def __iter__(self):
+        parent = self.parent
+        for i in self.indices:
+            yield parent[i]
+
+    def __str__(self):
+        return ''.join(f'{item}, ' for item in self)
+
+    def __buffer__(self, flags):
+        """
+        Buffer protocol (Python 3.12+): strided memoryview of the window
+        """
+        return self.as_memoryview()
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        numpy.asarray(view) wraps the strided memoryview without copying
+        """
+        import numpy as np
+        return np.asarray(self.as_memoryview(), dtype=dtype)
+
+    def as_memoryview(self):
+        """
+        Returns a zero-copy, strided memoryview of the window (typed parents only)
+        """
+        r = self.indices
+        view = self.parent.as_memoryview()
+        if len(r) == 0:
+            return view[0:0]  # e.g. range(-1, -1, -1): stop=None would export everything
+        stop = r.stop if r.stop >= 0 else None  # a non-empty range(..., -1, -k) runs down towards index 0
+        return view[r.start:stop:r.step]
+
+    def copy(self):
+        """
+        Returns the elements of the view as a new, independent DynamicArray
+        """
+        arr = DynamicArray(self.parent.typecode)
+        arr.insert_many(0, self)
+        return arr
+
 if __name__ == "__main__":
     arr = DynamicArray()
     # Append new element
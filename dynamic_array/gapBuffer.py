@@ -0,0 +1,251 @@
+"""
+Gap Buffer Reference: https://en.wikipedia.org/wiki/Gap_buffer
+
+Gap Buffer Definition: dynamic array whose unused capacity (the "gap") is kept
+at the position of the last edit instead of at the end of the array
+
+   [a, b, c, _, _, _, d, e]
+             ^gap_start ^gap_end
+
+Key Attributes:
+- Same API as DynamicArray (append, insert_at, remove_at, prepend, ...)
+- Inserting/deleting at the gap is O(1): the item goes into (or comes out of) the gap
+- Moving the gap to index i costs O(|i - gap_start|), a single block move
+- So editing around a moving cursor, or repeated prepends, is amortized O(1)
+  instead of O(n) per call
+- Random access stays O(1): logical index i is physical index i, or i + gap size
+  if it lies behind the gap
+
+Time
+O(1) index/update
+O(1) amortized insert/remove at the gap, O(distance) to move the gap
+"""
+import ctypes
+
+from dynamicArray import ArrayView, DynamicArray
+
+class GapBuffer(DynamicArray):
+    """
+    Dynamic array with a movable gap for localized edits
+    """
+    def __init__(self, typecode=None, growth=None):
+        super().__init__(typecode, growth)
+        self.gap_start = 0  # first free slot
+        self.gap_end = self.capacity  # first occupied slot after the gap
+
+    def __del__(self):
+        """
+        Release the references held by the occupied slots on both sides of the gap
+        """
+        if getattr(self, "n", 0):
+            self._release(0, self.gap_start)
+            self._release(self.gap_end, self.capacity)
+
+    def __getitem__(self, k):
+        """
+        Return element at index k, or a zero-copy ArrayView for a slice
+        """
+        if isinstance(k, slice):
+            return ArrayView(self, range(self.n)[k])
+        # check if k is valid
+        if k >= self.n or k < 0:
+            raise IndexError("k is out of bounds")
+        if k < self.gap_start:
+            return self.arr[k]
+        return self.arr[k + self.gap_end - self.gap_start]  # skip over the gap
+
+    def __str__(self):
+        return ''.join(f'{self[i]}, ' for i in range(self.n))
+
+    def insert_at(self, item, index):
+        """
+        This function inserts the item at any specified index.
+        """
+        # check if the index is valid
+        if self.n<index or index<0:
+            print("index is out of bounds")
+            return
+
+        # if the array is full, resize
+        self._grow_to(self.n+1)
+        # bring the gap to index and fill its first slot
+        self._move_gap(index)
+        self._store(self.gap_start, item)
+        self.gap_start+=1
+        self.n+=1
+
+    def append(self, ele):
+        """
+        Add element to end of the array
+        """
+        self.insert_at(ele, self.n)
+
+    def insert_many(self, index, iterable):
+        """
+        This function inserts all items of iterable starting at the specified index.
+        """
+        # check if the index is valid
+        if self.n<index or index<0:
+            print("index is out of bounds")
+            return
+        items = list(iterable)
+        k = len(items)
+        if k==0:
+            return
+
+        # grow until the batch fits
+        self._grow_to(self.n+k)
+        self._move_gap(index)
+        self._store_many(self.gap_start, items)
+        self.gap_start+=k
+        self.n+=k
+
+    def delete(self):
+        """
+        This function deletes item from the end of array
+        """
+        if self.n==0:
+            print("Empty array, deletion is not possible")
+            return
+        self.delete_range(self.n-1, self.n)
+
+    def pop(self):
+        """
+        Remove from end, return value
+        """
+        if self.n==0:
+            print("Empty array, pop is not possible")
+            return
+        temp = self[self.n-1]
+        self.delete_range(self.n-1, self.n)
+        return temp
+
+    def delete_range(self, start, stop):
+        """
+        This function deletes items in [start, stop) by widening the gap over them.
+        """
+        if start<0 or stop>self.n or stop<start:
+            print("invalid range")
+            return
+        k = stop-start
+        if k==0:
+            return
+        # bring the gap to start; the items then sit right after the gap
+        self._move_gap(start)
+        self._release(self.gap_end, self.gap_end+k)
+        ctypes.memset(self._addr(self.gap_end), 0, k*self.itemsize)
+        self.gap_end+=k
+        self.n-=k
+        self._shrink_if_sparse()
+
+    ############## whole-array passes run with the gap moved to the end ################
+    def find(self, item):
+        self._move_gap(self.n)
+        return super().find(item)
+
+    def find_all(self, item):
+        self._move_gap(self.n)
+        return super().find_all(item)
+
+    def count(self, item):
+        self._move_gap(self.n)
+        return super().count(item)
+
+    def remove_all(self, item):
+        self._move_gap(self.n)
+        removed = super().remove_all(item)
+        self.gap_start = self.n
+        return removed
+
+    def filter_inplace(self, predicate):
+        self._move_gap(self.n)
+        removed = super().filter_inplace(predicate)
+        self.gap_start = self.n
+        return removed
+
+    def as_memoryview(self):
+        """
+        Returns a zero-copy memoryview over the n elements (typed mode only).
+        The gap is first moved to the end so the elements are contiguous.
+        """
+        self._move_gap(self.n)
+        return super().as_memoryview()
+
+    def _move_gap(self, index):
+        """
+        Moves the gap so that it starts at logical index
+        """
+        gap = self.gap_end - self.gap_start
+        if index < self.gap_start:
+            # slide [index, gap_start) to the back side of the gap
+            k = self.gap_start - index
+            self._move(self.gap_end-k, index, k)
+            vacated = min(k, gap)
+            ctypes.memset(self._addr(index), 0, vacated*self.itemsize)
+        elif index > self.gap_start:
+            # slide the first k items behind the gap to the front side
+            k = index - self.gap_start
+            self._move(self.gap_start, self.gap_end, k)
+            vacated = min(k, gap)
+            ctypes.memset(self._addr(self.gap_end+k-vacated), 0, vacated*self.itemsize)
+        else:
+            return
+        self.gap_start = index
+        self.gap_end = index + gap
+
+    def _resize(self, new_cap):
+        """
+        Resize internal array to capacity new_cap, keeping the gap in place
+        """
+        back = self.capacity - self.gap_end  # no. of items behind the gap
+        front = self.n - back  # no. of items before the gap
+        temp = self.make_array(new_cap)
+        # pointers (ownership) of both halves move to the new buffer
+        ctypes.memmove(temp, self.arr, front*self.itemsize)
+        ctypes.memmove(ctypes.addressof(temp) + (new_cap-back)*self.itemsize,
+                       self._addr(self.gap_end), back*self.itemsize)
+        self._set_buffer(temp)
+        self._record_resize(new_cap, self.n*self.itemsize)
+        self.capacity = new_cap
+        self.gap_start = front
+        self.gap_end = new_cap - back
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    gb = GapBuffer()
+    for i in range(5):
+        gb.prepend(i)
+    print("After prepending 0..4, gb = ", gb)
+    gb.insert_at(-1, 2)
+    print("After insert_at(-1, 2), gb = ", gb)
+    gb.remove_at(0)
+    print("After remove_at(0), gb = ", gb)
+    print("current capacity is = ", gb.capacity)
+
+    ############## Benchmark ################
+    def front_insert(arr, n):
+        for i in range(n):
+            arr.prepend(i)
+
+    def localized_edits(arr, n, seed=0):
+        # a cursor wandering by a few slots, inserting and occasionally deleting
+        rng = random.Random(seed)
+        arr.extend(range(n))
+        cursor = n // 2
+        for i in range(n):
+            cursor = min(max(cursor + rng.randint(-3, 3), 0), len(arr) - 1)
+            if rng.random() < 0.7:
+                arr.insert_at(i, cursor)
+            else:
+                arr.remove_at(cursor)
+
+    print("\nBenchmark (seconds)")
+    for n in (10000, 100000):
+        for name, trace in (("front-insert", front_insert), ("localized-edit", localized_edits)):
+            for cls in (DynamicArray, GapBuffer):
+                arr = cls()
+                start = time.perf_counter()
+                trace(arr, n)
+                print(f"{name:>15} n={n:<7} {cls.__name__:<13} {time.perf_counter() - start:.4f}")
@@ -0,0 +1,204 @@
+"""
+mmap Reference: https://docs.python.org/3/library/mmap.html
+
+Memory-Mapped Array Definition: typed dynamic array whose buffer is a
+memory-mapped file instead of heap memory
+
+File layout:
+   [header: 64 bytes][slot 0][slot 1] ... [slot capacity-1]
+   header = magic (8 bytes) | typecode (1 byte) | padding | n (uint64 at offset 16)
+
+Key Attributes:
+- Same API and growth/shrink policy as DynamicArray(typecode=...);
+  growing doubles the file and remaps it
+- Data lives in the OS page cache, so the array can be larger than RAM
+  and only the touched pages are loaded
+- Contents persist: reopening an existing file only maps it, O(1) regardless of size
+- readonly=True maps the file copy-on-write, so many processes can share the
+  same page-cache pages while reading
+
+Time
+Same as DynamicArray; the first touch of a page may cost a disk read
+"""
+import ctypes
+import mmap
+import os
+
+from dynamicArray import DynamicArray, TYPECODES
+
+MAGIC = b'DYNARR01'
+HEADER_SIZE = 64  # keeps the slots aligned for every typecode
+_N_OFFSET = 16
+
+class MappedArray(DynamicArray):
+    """
+    File-backed typed dynamic array
+    """
+    def __init__(self, path, typecode=None, readonly=False, growth=None):
+        self.path = path
+        self.readonly = readonly
+        self._file = None
+        self._mm = None
+        self._n = None
+        if os.path.exists(path):
+            self._file = open(path, 'rb' if readonly else 'r+b')
+            header = self._file.read(HEADER_SIZE)
+            if len(header) < HEADER_SIZE or header[:8] != MAGIC:
+                self._file.close()
+                raise ValueError(f"'{path}' is not a MappedArray file")
+            stored = chr(header[8])
+            if typecode is not None and typecode != stored:
+                self._file.close()
+                raise ValueError(f"'{path}' holds typecode '{stored}', not '{typecode}'")
+            typecode = stored
+        else:
+            if readonly:
+                raise FileNotFoundError(path)
+            if typecode not in TYPECODES:
+                raise ValueError(f"bad typecode '{typecode}', must be one of {''.join(TYPECODES)}")
+            self._file = open(path, 'w+b')
+            self._file.write(MAGIC + typecode.encode() + bytes(HEADER_SIZE - 9))
+            self._file.truncate(HEADER_SIZE + ctypes.sizeof(TYPECODES[typecode]))  # capacity 1
+        self.typecode = typecode
+        self._ctype = TYPECODES[typecode]
+        self.itemsize = ctypes.sizeof(self._ctype)
+        self._map()
+        self._init_growth(growth)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        """
+        Unmap and close the file
+        """
+        self.close()
+
+    @property
+    def n(self):
+        """
+        Number of elements, stored in the file header
+        """
+        return self._n.value
+
+    @n.setter
+    def n(self, value):
+        self._n.value = value
+
+    def flush(self):
+        """
+        Writes dirty pages back to the file
+        """
+        if self._mm is not None and not self.readonly:
+            self._mm.flush()
+
+    def close(self):
+        """
+        Flushes and unmaps the file; the array is unusable afterwards
+        """
+        if getattr(self, "_mm", None) is not None:
+            self.flush()
+            self._unmap()
+        if getattr(self, "_file", None) is not None:
+            self._file.close()
+            self._file = None
+
+    ############## mutators refuse to run on a read-only mapping ################
+    def append(self, ele):
+        self._check_writable()
+        super().append(ele)
+
+    def insert_at(self, item, index):
+        self._check_writable()
+        super().insert_at(item, index)
+
+    def insert_many(self, index, iterable):
+        self._check_writable()
+        super().insert_many(index, iterable)
+
+    def delete(self):
+        self._check_writable()
+        super().delete()
+
+    def pop(self):
+        self._check_writable()
+        return super().pop()
+
+    def delete_range(self, start, stop):
+        self._check_writable()
+        super().delete_range(start, stop)
+
+    def reserve(self, n):
+        self._check_writable()
+        super().reserve(n)
+
+    def shrink_to_fit(self):
+        self._check_writable()
+        super().shrink_to_fit()
+
+    def remove_all(self, item):
+        self._check_writable()
+        return super().remove_all(item)
+
+    def filter_inplace(self, predicate):
+        self._check_writable()
+        return super().filter_inplace(predicate)
+
+    def _check_writable(self):
+        if self.readonly:
+            raise PermissionError(f"'{self.path}' is opened read-only")
+
+    def _resize(self, new_cap):
+        """
+        Resize the file to hold new_cap slots and remap it.
+        Exported memoryviews must be released first.
+        """
+        self._unmap()
+        self._file.truncate(HEADER_SIZE + new_cap*self.itemsize)
+        self._map()
+        self._record_resize(new_cap, 0)  # the file is resized in place, nothing is copied
+
+    def _map(self):
+        """
+        Maps the file and binds the header and slot views
+        """
+        size = os.fstat(self._file.fileno()).st_size
+        access = mmap.ACCESS_COPY if self.readonly else mmap.ACCESS_WRITE
+        self._mm = mmap.mmap(self._file.fileno(), size, access=access)
+        self.capacity = (size - HEADER_SIZE) // self.itemsize
+        self._n = ctypes.c_uint64.from_buffer(self._mm, _N_OFFSET)
+        self._set_buffer((self._ctype * self.capacity).from_buffer(self._mm, HEADER_SIZE))
+
+    def _unmap(self):
+        """
+        Drops the views into the mapping and closes it
+        """
+        self.arr = None
+        self._n = None
+        self._mm.close()
+        self._mm = None
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    path = os.path.join(tempfile.mkdtemp(), "demo.dynarr")
+    with MappedArray(path, 'd') as ma:
+        ma.extend(float(i) for i in range(10))
+        ma.insert_at(-1.0, 0)
+        print("ma = ", ma)
+        print("current capacity is = ", ma.capacity)
+
+    # reopening only maps the file
+    start = time.perf_counter()
+    ro = MappedArray(path, readonly=True)
+    print(f"\nreopened read-only in {time.perf_counter() - start:.6f}s, len = {len(ro)}")
+    print("ro = ", ro)
+    try:
+        ro.append(1.0)
+    except PermissionError as e:
+        print("append on read-only:", e)
+    ro.close()
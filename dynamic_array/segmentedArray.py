@@ -0,0 +1,274 @@
+"""
+Tiered Vector Reference: https://www.ics.uci.edu/~goodrich/pubs/wads99.pdf
+
+Segmented (Tiered) Array Definition: dynamic array stored as a directory of
+fixed-size chunks instead of one contiguous block
+
+   directory -> [chunk 0][chunk 1][chunk 2] ... [chunk k (partially filled)]
+
+Key Attributes:
+- Growing adds one new chunk; existing elements are never copied,
+  so there is no O(n) resize stall and no transient 2-3x memory peak
+- Every chunk except the last is full, so index i lives in chunk i // B at
+  offset i % B -> O(1) random access through the directory
+- Each chunk is a circular buffer: pushing to the front of a full chunk and
+  popping its back is O(1), so a middle insert/delete shifts within one chunk
+  (O(B)) and then ripples one element through each later chunk (O(n/B))
+- With chunk_size B ~ sqrt(n) a middle insert/delete is O(sqrt n)
+
+Time
+O(1) index/update
+O(1) append/pop at the end (worst case, not just amortized)
+O(B + n/B) insert/remove elsewhere
+"""
+import ctypes
+
+from dynamicArray import ArrayView, TYPECODES
+
+class SegmentedArray(object):
+    """
+    Dynamic array built from fixed-size circular chunks
+    """
+    def __init__(self, chunk_size=1024, typecode=None):
+        if typecode is not None and typecode not in TYPECODES:
+            raise ValueError(f"bad typecode '{typecode}', must be one of {''.join(TYPECODES)}")
+        self.typecode = typecode
+        self._ctype = ctypes.py_object if typecode is None else TYPECODES[typecode]
+        self._empty = None if typecode is None else 0  # value of an unused slot
+        self.chunk_size = chunk_size
+        self.n = 0  # actual number of elements
+        self._chunks = []  # chunk directory
+        self._heads = []  # physical offset of each chunk's first element
+
+    @property
+    def capacity(self):
+        """
+        Number of items the allocated chunks can hold
+        """
+        return len(self._chunks) * self.chunk_size
+
+    def __len__(self):
+        """
+        Return number of elements stored in array
+        """
+        return self.n
+
+    def __getitem__(self, k):
+        """
+        Return element at index k, or a zero-copy ArrayView for a slice
+        """
+        if isinstance(k, slice):
+            return ArrayView(self, range(self.n)[k])
+        # check if k is valid
+        if k >= self.n or k < 0:
+            raise IndexError("k is out of bounds")
+        c, j = divmod(k, self.chunk_size)
+        return self._chunks[c][(self._heads[c] + j) % self.chunk_size]
+
+    def __setitem__(self, k, ele):
+        """
+        Overwrite element at index k
+        """
+        if k >= self.n or k < 0:
+            raise IndexError("k is out of bounds")
+        c, j = divmod(k, self.chunk_size)
+        self._chunks[c][(self._heads[c] + j) % self.chunk_size] = ele
+
+    def __str__(self):
+        return ''.join(f'{self[i]}, ' for i in range(self.n))
+
+    def append(self, ele):
+        """
+        Add element to end of the array
+        """
+        c, j = divmod(self.n, self.chunk_size)
+        # the last chunk is full: add a chunk, nothing is copied
+        if c == len(self._chunks):
+            self._add_chunk()
+        self._chunks[c][(self._heads[c] + j) % self.chunk_size] = ele
+        self.n += 1
+
+    def extend(self, iterable):
+        """
+        Add every element of iterable to the end of the array
+        """
+        for ele in iterable:
+            self.append(ele)
+
+    def insert_at(self, item, index):
+        """
+        This function inserts the item at any specified index.
+        """
+        # check if the index is valid
+        if self.n<index or index<0:
+            print("index is out of bounds")
+            return
+        B = self.chunk_size
+        if self.n == self.capacity:
+            self._add_chunk()
+        c, j = divmod(index, B)
+        last = self.n // B  # chunk that receives the overflow
+        if c == last:
+            self._shift_right(c, j, self.n - c*B)
+            self._set(c, j, item)
+        else:
+            # chunk c is full: its last element overflows into chunk c+1
+            carry = self._get(c, B-1)
+            self._shift_right(c, j, B-1)
+            self._set(c, j, item)
+            # full chunks in between: push carry to the front, pop the back
+            for k in range(c+1, last):
+                self._heads[k] = (self._heads[k] - 1) % B
+                chunk, h = self._chunks[k], self._heads[k]
+                carry, chunk[h] = chunk[h], carry
+            # last chunk has room at the front
+            self._heads[last] = (self._heads[last] - 1) % B
+            self._chunks[last][self._heads[last]] = carry
+        self.n += 1
+
+    def prepend(self, item):
+        """
+        This function inserts the item in front of the array
+        """
+        self.insert_at(item, 0)
+
+    def remove_at(self, index):
+        """
+        This function deletes item from a specified index.
+        """
+        # check index
+        if self.n==0:
+            print("Empty array, cannot delete")
+            return
+        if self.n-1<index or index<0:
+            return IndexError("invalid index")
+        B = self.chunk_size
+        c, j = divmod(index, B)
+        last = (self.n-1) // B
+        if c == last:
+            self._shift_left(c, j, self.n - c*B)
+            self._set(c, self.n - 1 - c*B, self._empty)
+        else:
+            self._shift_left(c, j, B)
+            # each later chunk hands its front element to the previous chunk's back
+            for k in range(c+1, last+1):
+                chunk, h = self._chunks[k], self._heads[k]
+                self._set(k-1, B-1, chunk[h])
+                chunk[h] = self._empty
+                self._heads[k] = (h + 1) % B
+        self.n -= 1
+        self._trim()
+
+    def delete(self):
+        """
+        This function deletes item from the end of array
+        """
+        if self.n==0:
+            print("Empty array, deletion is not possible")
+            return
+        self.pop()
+
+    def pop(self):
+        """
+        Remove from end, return value
+        """
+        if self.n==0:
+            print("Empty array, pop is not possible")
+            return
+        c, j = divmod(self.n-1, self.chunk_size)
+        temp = self._get(c, j)
+        self._set(c, j, self._empty)
+        self.n -= 1
+        self._trim()
+        return temp
+
+    def find(self, item):
+        # return the first known index
+        for i in range(self.n):
+            if self[i]==item:
+                return i
+        return -1
+
+    def _get(self, c, j):
+        """
+        Returns the element at local offset j of chunk c
+        """
+        return self._chunks[c][(self._heads[c] + j) % self.chunk_size]
+
+    def _set(self, c, j, ele):
+        """
+        Writes ele at local offset j of chunk c
+        """
+        self._chunks[c][(self._heads[c] + j) % self.chunk_size] = ele
+
+    def _shift_right(self, c, start, stop):
+        """
+        Moves local offsets [start, stop) of chunk c one slot to the right
+        """
+        for j in range(stop, start, -1):
+            self._set(c, j, self._get(c, j-1))
+
+    def _shift_left(self, c, start, stop):
+        """
+        Moves local offsets (start, stop) of chunk c one slot to the left
+        """
+        for j in range(start, stop-1):
+            self._set(c, j, self._get(c, j+1))
+
+    def _add_chunk(self):
+        """
+        Appends a new empty chunk to the directory
+        """
+        chunk = (self.chunk_size * self._ctype)()
+        if self.typecode is None:
+            chunk[:] = [None] * self.chunk_size
+        self._chunks.append(chunk)
+        self._heads.append(0)
+
+    def _trim(self):
+        """
+        Frees trailing empty chunks, keeping one spare to avoid thrashing at a boundary
+        """
+        used = -(-self.n // self.chunk_size)
+        while len(self._chunks) > used + 1:
+            self._chunks.pop()
+            self._heads.pop()
+
+if __name__ == "__main__":
+    import time
+    from dynamicArray import DynamicArray
+
+    sa = SegmentedArray(chunk_size=4)
+    for i in range(10):
+        sa.append(i)
+    print("sa = ", sa)
+    sa.insert_at(-1, 1)
+    print("After insert_at(-1, 1), sa = ", sa)
+    sa.remove_at(0)
+    print("After remove_at(0), sa = ", sa)
+    print("current capacity is = ", sa.capacity)
+
+    ############## Benchmark ################
+    def append_latency(arr, n):
+        samples = []
+        clock = time.perf_counter
+        for i in range(n):
+            start = clock()
+            arr.append(i)
+            samples.append(clock() - start)
+        samples.sort()
+        return samples[int(0.999 * n)], samples[-1]
+
+    n = 2000000
+    print(f"\nappend latency, n={n} (seconds)")
+    for arr in (DynamicArray(), SegmentedArray(chunk_size=2048)):
+        p999, worst = append_latency(arr, n)
+        print(f"{type(arr).__name__:<15} p99.9={p999:.2e} max={worst:.2e}")
+
+    print("\nmiddle insert x1000 (seconds)")
+    for arr in (DynamicArray(), SegmentedArray(chunk_size=2048)):
+        arr.extend(range(n))
+        start = time.perf_counter()
+        for i in range(1000):
+            arr.insert_at(i, n // 2)
+        print(f"{type(arr).__name__:<15} {time.perf_counter() - start:.4f}")
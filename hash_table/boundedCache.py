@@ -0,0 +1,359 @@
+"""[summary]
+Bounded cache built on HashTable and an intrusive doubly linked list
+
+The HashTable maps key -> entry, and the entry itself is the list node (prev/next live
+on the entry, no separate node objects), so get/put/evict are all O(1):
+- 'lru': one list in recency order; a hit moves the entry to the front, the back is evicted
+- 'lfu': one list per use count (a HashTable count -> list), the lists themselves linked
+  in ascending count order, plus the smallest count; a hit moves the entry to the next
+  count's list, the back of the smallest count's list (least recently used among the
+  least frequently used) is evicted, and an emptied list is unlinked from its neighbours
+- 'ttl': one list in expiry order; the entry closest to expiring is evicted and
+  expired entries are purged from the back on every put
+
+ttl (seconds) also works with 'lru' and 'lfu': an expired entry counts as a miss when read.
+
+Size limits: max_size entries and/or max_weight, where weigher(key, val) gives the weight of
+an entry (e.g. its size in bytes); an entry heavier than max_weight is never cached.
+
+LRU Cache Reference: https://en.wikipedia.org/wiki/Cache_replacement_policies
+O(1) LFU Reference: http://dhruvbird.com/lfu.pdf
+"""
+import functools
+import time
+
+from hashTable import HashTable
+
+POLICIES = ('lru', 'lfu', 'ttl')
+_MISSING = object()
+_KWARGS = object()  # separates positional from keyword arguments in memoize keys
+
+class _Entry(object):
+    """[summary]
+    Cache entry that is also its own doubly linked list node
+    """
+    __slots__ = ('key', 'val', 'weight', 'freq', 'expires', 'prev', 'next')
+
+    def __init__(self, key=None, val=None, weight=1, expires=None):
+        self.key = key
+        self.val = val
+        self.weight = weight
+        self.freq = 1  # no. of uses (LFU)
+        self.expires = expires  # clock() deadline, None = never
+        self.prev = None
+        self.next = None
+
+class _DList(object):
+    """[summary]
+    Circular doubly linked list around a sentinel, front = newest
+    ('lfu': freq = use count of its entries, lower/higher = neighbouring counts' lists)
+    """
+    def __init__(self, freq=0):
+        self.root = _Entry()
+        self.root.prev = self.root.next = self.root
+        self.n = 0
+        self.freq = freq
+        self.lower = None
+        self.higher = None
+
+    def push_front(self, node):
+        root = self.root
+        node.prev, node.next = root, root.next
+        root.next.prev = node
+        root.next = node
+        self.n += 1
+
+    def unlink(self, node):
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = node.next = None
+        self.n -= 1
+
+    def back(self):
+        """[summary]
+        Returns the oldest node, or None if the list is empty
+        """
+        return self.root.prev if self.n else None
+
+class BoundedCache(object):
+    """[summary]
+    Key-value cache with a size limit and LRU / LFU / TTL eviction
+
+    -get(key, default=None) value of key, or default on a miss (missing or expired)
+    -put(key, val) insert or replace, evicting entries while over max_size / max_weight
+    -remove(key), clear(), len(), in
+    -stats() hits, misses, evictions and expirations
+    """
+    def __init__(self, max_size=128, max_weight=None, weigher=None, policy='lru', ttl=None,
+                 clock=time.monotonic):
+        """[summary]
+        Initialize the cache
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}")
+        if policy == 'ttl' and ttl is None:
+            raise ValueError("policy 'ttl' needs a ttl")
+        if max_size is None and max_weight is None:
+            raise ValueError("need max_size and/or max_weight")
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.policy = policy
+        self.max_size = max_size
+        self.max_weight = max_weight
+        self.weigher = weigher
+        self.ttl = ttl
+        self.clock = clock
+        self.clear()
+
+    def __len__(self):
+        """[summary]
+        Returns the no. of cached entries (expired ones included until they are purged)
+        """
+        return len(self.table)
+
+    def __contains__(self, key):
+        """[summary]
+        Allow "key in cache" (does not count as a use)
+        """
+        node = self.table.get(key, None)
+        return node is not None and not self._expired(node)
+
+    def clear(self):
+        """[summary]
+        Drops every entry and resets the counters
+        """
+        self.table = HashTable()  # key -> entry
+        self.order = _DList()  # 'lru' / 'ttl' order
+        self.freqs = HashTable()  # 'lfu': use count -> entries with that count
+        self.min_freq = 1
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=None):
+        """[summary]
+        Returns the cached value of key, or default on a miss
+        """
+        node = self.table.get(key, None)
+        if node is None:
+            self.misses += 1
+            return default
+        if self._expired(node):
+            self._discard(node)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(node)
+        return node.val
+
+    def put(self, key, val):
+        """[summary]
+        Caches key:val, then evicts entries by policy until the limits hold again
+        """
+        weight = self.weigher(key, val) if self.weigher else 1
+        node = self.table.get(key, None)
+        if self.max_weight is not None and weight > self.max_weight:
+            # too heavy to ever fit: do not keep a stale value either
+            if node is not None:
+                self._discard(node)
+            return
+        expires = None if self.ttl is None else self.clock() + self.ttl
+        if node is not None:
+            self.weight += weight - node.weight
+            node.val, node.weight, node.expires = val, weight, expires
+            if self.policy == 'ttl':
+                # new deadline is the latest one: back to the front
+                self.order.unlink(node)
+                self.order.push_front(node)
+            else:
+                self._touch(node)
+        else:
+            node = _Entry(key, val, weight, expires)
+            self.table[key] = node
+            self.weight += weight
+            if self.policy == 'lfu':
+                lst = self.freqs.get(1, None)
+                if lst is None:
+                    lst = self._link_freq_list(1, None)  # the new smallest count
+                lst.push_front(node)
+                self.min_freq = 1
+            else:
+                self.order.push_front(node)
+        if self.policy == 'ttl':
+            self._purge_expired()
+        while self._over_limit():
+            self._discard(self._victim(node))
+            self.evictions += 1
+
+    def remove(self, key):
+        """[summary]
+        Drops key from the cache; returns False if it was not cached
+        """
+        node = self.table.get(key, None)
+        if node is None:
+            return False
+        self._discard(node)
+        return True
+
+    def stats(self):
+        """[summary]
+        Returns the hit/miss/eviction counters and the current size
+        """
+        lookups = self.hits + self.misses
+        return {'policy': self.policy, 'count': len(self.table), 'weight': self.weight,
+                'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions, 'expirations': self.expirations}
+
+    def _expired(self, node):
+        return node.expires is not None and node.expires <= self.clock()
+
+    def _over_limit(self):
+        return (self.max_size is not None and len(self.table) > self.max_size) or \
+            (self.max_weight is not None and self.weight > self.max_weight)
+
+    def _touch(self, node):
+        """[summary]
+        Records a use of node
+        """
+        if self.policy == 'lru':
+            self.order.unlink(node)
+            self.order.push_front(node)
+        elif self.policy == 'lfu':
+            lst = self.freqs.get(node.freq)
+            higher = lst.higher
+            if higher is None or higher.freq != node.freq + 1:
+                higher = self._link_freq_list(node.freq + 1, lst)
+            lst.unlink(node)
+            higher.push_front(node)
+            node.freq += 1
+            if lst.n == 0:
+                self._unlink_freq_list(lst)  # min_freq moves up to node.freq if lst was the smallest
+        # 'ttl': reads do not change the expiry order
+
+    def _link_freq_list(self, freq, lower):
+        """[summary]
+        'lfu': creates the list of entries used freq times, linked right after lower
+        (None = before the smallest count's list)
+        """
+        lst = _DList(freq)
+        higher = lower.higher if lower is not None else self.freqs.get(self.min_freq, None)
+        lst.lower, lst.higher = lower, higher
+        if lower is not None:
+            lower.higher = lst
+        if higher is not None:
+            higher.lower = lst
+        self.freqs[freq] = lst
+        return lst
+
+    def _unlink_freq_list(self, lst):
+        """[summary]
+        'lfu': drops an emptied count's list, the next count's list takes over as smallest
+        """
+        self.freqs.remove(lst.freq)
+        if lst.lower is not None:
+            lst.lower.higher = lst.higher
+        if lst.higher is not None:
+            lst.higher.lower = lst.lower
+        if self.min_freq == lst.freq:
+            self.min_freq = lst.higher.freq if lst.higher is not None else 1
+        lst.lower = lst.higher = None
+
+    def _victim(self, protect):
+        """[summary]
+        Returns the entry to evict next, never protect (the entry just put)
+        """
+        if self.policy != 'lfu':
+            return self.order.back()  # protect is at the front: the back only if it is alone
+        lst = self.freqs.get(self.min_freq)
+        node = lst.back()
+        if node is protect:
+            if node.prev is not lst.root:
+                return node.prev
+            # protect is alone at the smallest count: evict from the next count
+            return lst.higher.back()
+        return node
+
+    def _discard(self, node):
+        """[summary]
+        Unlinks node from the table and its list
+        """
+        self.table.remove(node.key)
+        self.weight -= node.weight
+        if self.policy == 'lfu':
+            lst = self.freqs.get(node.freq)
+            lst.unlink(node)
+            if lst.n == 0:
+                self._unlink_freq_list(lst)
+        else:
+            self.order.unlink(node)
+
+    def _purge_expired(self):
+        """[summary]
+        'ttl': drops expired entries from the back of the expiry-ordered list
+        """
+        node = self.order.back()
+        now = self.clock()
+        while node is not None and node.expires <= now:
+            self._discard(node)
+            self.expirations += 1
+            node = self.order.back()
+
+def memoize(func=None, **cache_options):
+    """[summary]
+    Decorator caching func's results in a BoundedCache (keyword options as for BoundedCache):
+    @memoize, or @memoize(max_size=1024, policy='lfu', ttl=60)
+    The cache is available as func.cache; arguments must be hashable.
+    """
+    def decorate(func):
+        cache = BoundedCache(**cache_options)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args + (_KWARGS,) + tuple(sorted(kwargs.items())) if kwargs else args
+            val = cache.get(key, _MISSING)
+            if val is _MISSING:
+                val = func(*args, **kwargs)
+                cache.put(key, val)
+            return val
+
+        wrapper.cache = cache
+        return wrapper
+    return decorate(func) if func is not None else decorate
+
+if __name__ == "__main__":
+    import random
+
+    cache = BoundedCache(max_size=3)
+    for key in ("a", "b", "c"):
+        cache.put(key, key.upper())
+    cache.get("a")  # "b" is now the least recently used
+    cache.put("d", "D")
+    print(f"lru: 'b' in cache = {'b' in cache}, 'a' in cache = {'a' in cache}")
+
+    cache = BoundedCache(max_weight=10, weigher=lambda key, val: len(val))
+    cache.put(1, "x" * 6)
+    cache.put(2, "y" * 6)
+    print(f"by weight: keys = {list(cache.table.keys())}, weight = {cache.weight}")
+
+    @memoize(max_size=256)
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+    print(f"fib(200) = {fib(200)}, {fib.cache.stats()}")
+
+    ############## Hit rate per policy on a skewed key stream ################
+    rng = random.Random(0)
+    stream = [int(rng.paretovariate(1.1)) for _ in range(100000)]
+    print("\nhit rate, 100000 lookups, max_size=100")
+    for policy in ('lru', 'lfu'):
+        cache = BoundedCache(max_size=100, policy=policy)
+        start = time.perf_counter()
+        for key in stream:
+            if cache.get(key) is None:
+                cache.put(key, key)
+        st = cache.stats()
+        print(f"{policy:<4} hit_rate={st['hit_rate']:.3f} evictions={st['evictions']} "
+              f"{time.perf_counter() - start:.2f}s")
@@ -19,9 +19,88 @@ Linear Probing Technique: https://runestone.academy/runestone/books/published/py
 
 
 """
+import multiprocessing
+from array import array
+
+_TOMBSTONE = object()  # key of a removed entry
+_MISSING = object()  # get() without a default
+EMPTY = -1  # index slot never used: probes stop here
+DUMMY = -2  # index slot whose entry was removed or migrated: probes continue past it
+
+def _next_prime(n):
+    """[summary]
+    Returns the smallest prime >= n (table sizes stay prime for linear probing)
+    """
+    n = max(n, 2)
+    while any(n % d == 0 for d in range(2, int(n**0.5) + 1)):
+        n += 1
+    return n
+
+def _next_power_of_two(n):
+    """[summary]
+    Returns the smallest power of two >= n (quadratic probing visits every slot of such a table)
+    """
+    return 1 << max(n - 1, 1).bit_length()
+
+def _index_typecode(capacity):
+    """[summary]
+    Returns the smallest integer typecode that can hold an entry number of a
+    capacity-slot index (1 byte per slot for small tables, like CPython)
+    """
+    for typecode in ('b', 'h', 'l', 'q'):
+        if capacity < 1 << (8 * array(typecode).itemsize - 1):
+            return typecode
+
+def _index_limit(indices):
+    """[summary]
+    Returns the first entry number that does not fit the index array's typecode
+    """
+    return 1 << (8 * indices.itemsize - 1)
+
+def _make_index(capacity, length=None):
+    """[summary]
+    Returns an index array of EMPTY slots for a capacity-slot table
+    (length slots of it if given, e.g. one worker's range in from_items)
+    """
+    return array(_index_typecode(capacity), [EMPTY]) * (capacity if length is None else length)
+
+PARALLEL_MIN_ITEMS = 50000  # from_items: below this a process pool costs more than it saves
+_BULK = None  # (hashes, keys, capacity, bounds, buckets) shared with forked from_items workers
+
+def _build_range(part):
+    """[summary]
+    from_items worker: linear-probes the entries of buckets[part] (the ones whose home slot
+    lies in [bounds[part], bounds[part + 1]), in insertion order) into a local index of those
+    slots. Returns the local index, the entries whose probe ran past the end of the range
+    (spilled, for the parent to place) and (first, later) entry pairs with equal keys.
+    """
+    hashes, keys, capacity, bounds, buckets = _BULK
+    lo = bounds[part]
+    size = bounds[part + 1] - lo
+    local = _make_index(capacity, size)
+    spilled, duplicates = [], []
+    for ix in buckets[part]:
+        h = hashes[ix]
+        pos = h % capacity - lo
+        key = keys[ix]
+        while pos < size:
+            j = local[pos]
+            if j == EMPTY:
+                local[pos] = ix
+                break
+            if hashes[j] == h and (keys[j] is key or keys[j] == key):
+                duplicates.append((j, ix))
+                break
+            pos += 1
+        else:
+            spilled.append(ix)
+    return local, spilled, duplicates
+
+PROBING = ('linear', 'quadratic', 'double', 'robin_hood')
+
 class HashTable(object):
     """[summary]
-    Hash table with liner probing for collision resolution (w/o dynamic resizing)
+    Hash table with liner probing for collision resolution, resized by load factor
     
     -HashMap() Create a new, empty map. It returns an empty map collection.
     -insert(key,val) Add a new key-value pair to the map. If the key is already in the map then replace the old value with the new value.
@@ -29,22 +108,173 @@ class HashTable(object):
     -remove() Delete the key-value pair from the map using a statement of the form del map[key].
     -len() Return the number of key-value pairs stored in the map.
     -in Return True for a statement of the form key in map, if the given key is in the map, False otherwise.
+    -keys(), values(), items() Iterate in insertion order
+    -HashTable.from_items(pairs, workers=N) Bulk build, pre-sized, optionally in a process pool
+    -save(path), HashTable.open(path, mmap=True) On-disk snapshot, served read-only from a mapping
+    -attach_filter(f) Bloom / cuckoo filter (membershipFilter) in front of get() and in:
+      a key the filter has never seen is a miss without probing
+
+    Layout (compact, like CPython's dict):
+    - entries: dense lists hashes / entry_keys / entry_vals in insertion order
+    - indices: capacity-sized array of small ints pointing into the entries
+      (EMPTY = never used, DUMMY = removed)
+    - probes compare the stored hash before the key, so hash(key) is computed once per
+      operation and == only runs on a real hash match
+    - iteration and __str__ walk the dense entries, proportional to len() not capacity
+
+    Resizing:
+    - grows (~2x, next prime) once count/capacity would exceed max_load
+    - shrinks (~1/2) once count/capacity drops below min_load (never below the initial capacity)
+    - incremental=True migrates the old index rehash_step slots per operation (like Redis)
+      instead of rehashing everything inside one insert; lookups check both indices meanwhile
+      (the entries never move, so insertion order is kept)
+
+    Deletion:
+    - remove() leaves a DUMMY in the index so probe chains through the slot stay intact,
+      which lets every probe stop at the first never-used (EMPTY) slot
+    - insert() reuses the first DUMMY on its probe path
+    - the index is rebuilt in place once DUMMY slots exceed max_tombstones of the capacity
+    - removed entries leave holes in the dense lists; they are squeezed out on the next
+      full rebuild, or right away once they outnumber the live entries
+
+    Probing (collision resolution), chosen per table:
+    - 'linear': +1, +1, ... (prime capacity)
+    - 'quadratic': +1, +2, +3, ... i.e. triangular offsets (power-of-two capacity, visits every slot)
+    - 'double': fixed step 1 + (hash // capacity) % (capacity - 1) per key (prime capacity)
+    - 'robin_hood': linear, but an insert takes the slot of any resident that is closer to
+      its home slot, evening out probe lengths; a miss stops as soon as it has probed further
+      than the resident it meets, and remove() shifts the following entries back
+      (no DUMMY slots)
+    stats() reports probe lengths and cluster sizes to compare strategies per key distribution
     """
-    def __init__(self, capacity=11, verbose=False):
+    def __init__(self, capacity=11, verbose=False, max_load=0.75, min_load=0.125,
+                 incremental=False, rehash_step=8, max_tombstones=0.2, probing='linear'):
         """[summary]
         Initialize the table 
         """
+        if not 0 < max_load < 1 or not 0 <= min_load < max_load/2:
+            raise ValueError("need 0 < max_load < 1 and 0 <= min_load < max_load/2")
+        if probing not in PROBING:
+            raise ValueError(f"probing must be one of {PROBING}")
+        self.probing = probing
+        if probing == 'quadratic':
+            capacity = _next_power_of_two(capacity)
+        elif probing == 'double':
+            capacity = _next_prime(capacity)  # every step size must be coprime with it
         self.capacity = capacity  # prime number is better for linear probing
-        self.keys = [None] * self.capacity  # for storing keys
-        self.vals = [None] * self.capacity  # for storing values
+        self.indices = _make_index(capacity)  # slot -> entry number
+        self.hashes = []  # dense entries, in insertion order
+        self.entry_keys = []
+        self.entry_vals = []
         self.count = 0  # number of key,val pairs present
+        self.tombstones = 0  # no. of DUMMY slots in the current index
+        self.deleted = 0  # no. of removed entries still in the dense lists
         self.verbose = verbose  # for debugging
+        self.max_load = max_load
+        self.min_load = min_load
+        self.min_capacity = capacity
+        self.max_tombstones = max_tombstones
+        self.incremental = incremental
+        self.rehash_step = rehash_step
+        # index being migrated in incremental mode (None when no rehash is running)
+        self.old_indices = None
+        self.old_capacity = 0
+        self.migrate_pos = 0  # next old slot to migrate
+        self.filter = None  # approximate membership filter of the keys, see attach_filter
+
+    @classmethod
+    def from_items(cls, iterable, workers=1, **table_options):
+        """[summary]
+        Builds a table from (key, value) pairs (later pairs win, like repeated insert)
+        sized for all of them up front, so no insert triggers a resize.
+
+        With workers > 1 (linear probing, a fork-capable OS, >= PARALLEL_MIN_ITEMS pairs),
+        the slots are split into workers contiguous ranges, the entries are bucketed by the
+        range their home slot lies in, and a process pool probes each range's bucket in
+        parallel; the entries whose probe runs past the end of their range are placed
+        afterwards. Equal keys share a
+        home slot, so each worker also finds the duplicates of its own keys.
+        """
+        items = iterable if isinstance(iterable, list) else list(iterable)
+        table = cls(**table_options)
+        n = len(items)
+        capacity = max(table.capacity, table._next_capacity(int((n + 1) / table.max_load) + 1))
+        table.capacity = capacity
+        table.indices = _make_index(capacity)
+        parallel = (workers > 1 and n >= PARALLEL_MIN_ITEMS and table.probing == 'linear'
+                    and 'fork' in multiprocessing.get_all_start_methods())
+        if not parallel:
+            for key, val in items:
+                table.insert(key, val)
+            return table
+
+        keys = [key for key, _ in items]
+        vals = [val for _, val in items]
+        hashes = list(map(hash, keys))
+        # forked workers inherit the lists (and hash seed) instead of receiving a pickled copy
+        global _BULK
+        bounds = [capacity * p // workers for p in range(workers + 1)]
+        # one pass buckets the entries by range (slot s lies in ((s + 1) * workers - 1) // capacity),
+        # so each worker visits only its own share instead of scanning all n
+        buckets = [[] for _ in range(workers)]
+        for ix, h in enumerate(hashes):
+            buckets[((h % capacity + 1) * workers - 1) // capacity].append(ix)
+        _BULK = (hashes, keys, capacity, bounds, buckets)
+        try:
+            with multiprocessing.get_context('fork').Pool(workers) as pool:
+                parts = pool.map(_build_range, range(workers))
+        finally:
+            _BULK = None
+        table.hashes, table.entry_keys, table.entry_vals = hashes, keys, vals
+        table.count = n
+        table.indices = array(_index_typecode(capacity))
+        for local, _, _ in parts:
+            table.indices += local
+
+        def merge_duplicate(first, later):
+            # the key keeps its first position with the later value
+            vals[first] = vals[later]
+            keys[later] = _TOMBSTONE
+            vals[later] = None
+            table.deleted += 1
+            table.count -= 1
+
+        for _, _, duplicates in parts:
+            for first, later in duplicates:
+                merge_duplicate(first, later)
+        for ix in sorted(ix for _, spilled, _ in parts for ix in spilled):
+            pos = table._find(table.indices, capacity, keys[ix], hashes[ix])
+            if pos != -1:
+                merge_duplicate(table.indices[pos], ix)
+            else:
+                table._place(ix)
+        if table.deleted > max(table.count, 8):
+            table._resize(capacity, compact=True)
+        return table
+
+    def save(self, path):
+        """[summary]
+        Writes the table to path as a versioned snapshot (see mappedHashTable)
+        """
+        from mappedHashTable import write_snapshot
+        write_snapshot(path, self.items())
+
+    @classmethod
+    def open(cls, path, mmap=True, **table_options):
+        """[summary]
+        Opens a snapshot written by save(): mmap=True returns a read-only MappedHashTable
+        that looks keys up in the mapped file, mmap=False loads it into a new table
+        """
+        from mappedHashTable import MappedHashTable, read_snapshot
+        if mmap:
+            return MappedHashTable(path)
+        return cls.from_items(read_snapshot(path), **table_options)
 
     def __str__(self):
         """[summary]
         Returns string representation
         """
-        return str([[key, val] for key, val in zip(self.keys, self.vals)])
+        return str([[key, val] for key, val in self.items()])
 
     def __len__(self):
         """[summary]
@@ -64,108 +294,391 @@ class HashTable(object):
         """
         self.insert(key, val)
 
-    def hash_function(self, key):
+    def __contains__(self, key):
+        """[summary]
+        Allow "key in table"
+        """
+        h = hash(key)
+        if self.filter is not None and not self.filter.contains_hash(h):
+            return False
+        self._migrate_step()
+        return self._find(self.indices, self.capacity, key, h) != -1 or \
+            (self.old_indices is not None and self._find(self.old_indices, self.old_capacity, key, h) != -1)
+
+    def __iter__(self):
+        """[summary]
+        Iterate over the keys in insertion order
+        """
+        return self.keys()
+
+    def keys(self):
+        """[summary]
+        Generator over the keys in insertion order
+        """
+        return (key for key in self.entry_keys if key is not _TOMBSTONE)
+
+    def values(self):
+        """[summary]
+        Generator over the values in insertion order
+        """
+        return (val for key, val in zip(self.entry_keys, self.entry_vals) if key is not _TOMBSTONE)
+
+    def items(self):
+        """[summary]
+        Generator over the (key, value) pairs in insertion order
+        """
+        return ((key, val) for key, val in zip(self.entry_keys, self.entry_vals) if key is not _TOMBSTONE)
+
+    def hash_function(self, key, size=None):
         """[summary]
         Hash function returns a hash value of the provided key
         Args:
             key ([type]): key
-            size ([type]): size of the table
+            size ([type]): size of the table (defaults to the current capacity)
+        """
+        return hash(key) % (size or self.capacity)
+
+    def rehash(self, old_hash, size=None, step=1):
+        """[summary]
+        Rehashing: next slot step away (linear probing of +1 by default)
+        """
+        return (old_hash + step) % (size or self.capacity)
+
+    def probe_step(self, hash_val, size=None):
+        """[summary]
+        First step of the probe sequence for a full hash value
+        (only double hashing depends on the key)
         """
-        return hash(key) % self.capacity
+        size = size or self.capacity
+        if self.probing == 'double' and size > 2:
+            return 1 + (hash_val // size) % (size - 1)  # second hash, never 0
+        return 1
 
-    def rehash(self, old_hash):
+    def load_factor(self):
         """[summary]
-        Rehashing with linear probing of +1
+        Returns count/capacity of the current table
         """
-        return (old_hash + 1) % self.capacity
+        return self.count / self.capacity
 
-    # def find_slot(self, key):
-    #     """[summary]
-    #     Return the slot number for the provided key to either input or overwrite existing key
-    #     """
+    def is_rehashing(self):
+        """[summary]
+        Returns True while an incremental rehash is migrating the old index
+        """
+        return self.old_indices is not None
     
     def insert(self, key, val):
         """[summary]
         Inserts the key:value pair into the table;
-        if collision occurs, then use linear probing method to find
+        if collision occurs, then use the probing method to find
         the next available slot
         """
-        hash_val = self.hash_function(key)
-        # if the slot is empty, put it in
-        if self.keys[hash_val] is None:
-            self.keys[hash_val] = key
-            self.vals[hash_val] = val
-            self.count += 1
-        # else,
-        else:
-            # check if the key already exists
-            if self.keys[hash_val] == key:
-                self.vals[hash_val] = val  # replace
-            # else if the keys are not the same (but identical hash vals),
+        h = hash(key)
+        self._migrate_step()
+        if (self.count + self.tombstones + 1) > self.max_load * self.capacity:
+            # grow if the live pairs need it, else just rebuild without tombstones
+            if (self.count + 1) > self.max_load * self.capacity / 2:
+                self._resize(self._next_capacity(2 * self.capacity))
             else:
-                next_hval = hash_val  # re-hashed value
-                # rehash until key[next_hval] is None or == key
-                while self.keys[next_hval] != None and \
-                    self.keys[next_hval] != key:
-                    # for debugging
-                    if self.verbose:
-                        print(f"current pos = {next_hval}, rehashing to = {self.rehash(next_hval)}")
-                    next_hval = self.rehash(next_hval)
-
-                # if the next found spot is an empty slot
-                if self.keys[next_hval] is None:
-                    self.keys[next_hval] = key
-                    self.vals[next_hval] = val
-                # re-hashed value has the same key,
-                elif self.keys[next_hval] == key:
-                    self.vals[next_hval] = val
-            self.count += 1
-    
-    def get(self, key):
+                self._resize(self.capacity)
+        pos = self._find(self.indices, self.capacity, key, h)
+        if pos != -1:
+            self.entry_vals[self.indices[pos]] = val  # replace
+            return
+        if self.old_indices is not None:
+            pos = self._find(self.old_indices, self.old_capacity, key, h)
+            if pos != -1:
+                # the key still lives in the old index: move its entry over, then replace
+                ix = self.old_indices[pos]
+                self.old_indices[pos] = DUMMY
+                self.entry_vals[ix] = val
+                self._place(ix)
+                return
+        if len(self.entry_keys) >= _index_limit(self.indices):
+            # removed entries pushed the entry numbers past the index typecode:
+            # squeeze them out (the live entries always fit a capacity-slot index)
+            self._resize(self.capacity, compact=True)
+        if self.filter is not None:
+            self._filter_add(h)  # before the table changes (it only needs the hash)
+        self.hashes.append(h)
+        self.entry_keys.append(key)
+        self.entry_vals.append(val)
+        try:
+            self._place(len(self.entry_keys) - 1)
+        except OverflowError:
+            # the index is unchanged (the new entry number is the first thing written): roll back
+            self.hashes.pop()
+            self.entry_keys.pop()
+            self.entry_vals.pop()
+            raise
+        self.count += 1
+
+    def get(self, key, default=_MISSING):
         """[summary]
         Get item with the provided key, if it exits
+        (a missing key returns default if one is given, else reports and returns -1)
         """
-        init_slot = self.hash_function(key)  # initial slot for hash val
-        # if the keys match, return val
-        if self.keys[init_slot] == key:
-            return self.vals[init_slot]
-        else:
-            pos = self.rehash(init_slot)
-            # linearly probe until either 
-            # 1. the key is found or 
-            # 2. the rehashed value returns to the initial hash value (init_slot)
-            while self.keys[pos] != key and pos != init_slot:
-                pos = self.rehash(pos)
-            # if we went through the entire table, output -1
-            if pos == init_slot:
-                print("Key Error: provided key does not exist!")
-                return -1 # not found
-            else:
-                return self.vals[pos]  # since self.keys[pos] = key
+        h = hash(key)
+        if self.filter is None or self.filter.contains_hash(h):
+            self._migrate_step()
+            pos = self._find(self.indices, self.capacity, key, h)
+            if pos != -1:
+                return self.entry_vals[self.indices[pos]]
+            if self.old_indices is not None:
+                pos = self._find(self.old_indices, self.old_capacity, key, h)
+                if pos != -1:
+                    return self.entry_vals[self.old_indices[pos]]
+        if default is not _MISSING:
+            return default
+        print("Key Error: provided key does not exist!")
+        return -1 # not found
 
     def remove(self, key):
         """[summary]
         With the provided key, remove the item from the hash table
         """
-        init_slot = self.hash_function(key)
-        # if the keys match, remove the data
-        if self.keys[init_slot] == key:
-            self.keys[init_slot] = None
-            self.vals[init_slot] = None
-            self.count -= 1
-        # else, linearly probe for the next position
+        self._migrate_step()
+        h = hash(key)
+        pos = self._find(self.indices, self.capacity, key, h)
+        old_pos = -1
+        if pos == -1 and self.old_indices is not None:
+            old_pos = self._find(self.old_indices, self.old_capacity, key, h)
+        if pos != -1:
+            ix = self.indices[pos]
+            if self.probing == 'robin_hood':
+                self._backward_shift(pos)
+            else:
+                # a DUMMY (not EMPTY) keeps the probe chains through this slot intact
+                self.indices[pos] = DUMMY
+                self.tombstones += 1
+        elif old_pos != -1:
+            ix = self.old_indices[old_pos]
+            self.old_indices[old_pos] = DUMMY
         else:
-            pos = self.rehash(init_slot)
-            while self.keys[pos] != key and pos != init_slot:
-                pos = self.rehash(pos)
-            # either we have gone through the list or have found the key
-            if pos == init_slot:
-                print(f"Key Error: '{key}' does not exist!")
-                return -1 # not found
+            print(f"Key Error: '{key}' does not exist!")
+            return -1 # not found
+        self.entry_keys[ix] = _TOMBSTONE
+        self.entry_vals[ix] = None
+        self.deleted += 1
+        self.count -= 1
+        if self.filter is not None:
+            self.filter.discard_hash(h)
+        if self.count < self.min_load * self.capacity and self.capacity > self.min_capacity:
+            self._resize(max(self.min_capacity, self._next_capacity(self.capacity // 2)))
+        elif self.tombstones > self.max_tombstones * self.capacity:
+            self._resize(self.capacity)  # compact: rebuild without tombstones
+        elif self.deleted > max(self.count, 8):
+            self._resize(self.capacity, compact=True)  # squeeze the holes out of the entries
+
+    def attach_filter(self, membership_filter):
+        """[summary]
+        Puts an (empty) BloomFilter / CuckooFilter in front of get() and in, and adds
+        every key to it; None detaches. Once it outgrows its capacity it is replaced by
+        one twice as large (same type and fp_rate) built from the keys.
+        The filter is fed the keys' hash() values (add_hash / contains_hash), so it agrees
+        with the table's own hash() / == matching (1, 1.0 and True are one key).
+        """
+        f = membership_filter
+        while f is not None:
+            live = [h for h, key in zip(self.hashes, self.entry_keys) if key is not _TOMBSTONE]
+            if len(live) <= f.capacity and all(f.add_hash(h) for h in live):
+                break
+            f = type(f)(2 * max(len(live), f.capacity), f.fp_rate)  # full: start over larger
+        self.filter = f
+
+    def _filter_add(self, h):
+        """[summary]
+        Adds the hash of a new key to the filter, rebuilding a larger one when it is full
+        """
+        while len(self.filter) >= self.filter.capacity or not self.filter.add_hash(h):
+            f = self.filter
+            self.attach_filter(type(f)(2 * (self.count + 1), f.fp_rate))
+
+    def stats(self):
+        """[summary]
+        Returns probe-length and cluster statistics of the current index:
+        probe length = no. of slots examined to find a key (1 = found at its home slot),
+        cluster = maximal run of used slots (DUMMY included)
+        """
+        lengths = [self._probe_length(ix) for ix in self.indices if ix >= 0]
+        clusters = []
+        run = 0
+        for ix in self.indices.tolist() + [EMPTY]:
+            if ix == EMPTY:
+                if run:
+                    clusters.append(run)
+                run = 0
             else:
-                self.keys[pos] = None  # since self.keys[pos] = key
-                self.vals[pos] = None
-            self.count -= 1
+                run += 1
+        # a run touching both ends wraps around
+        if len(clusters) > 1 and self.indices[0] != EMPTY and self.indices[-1] != EMPTY:
+            clusters[0] += clusters.pop()
+        return {'probing': self.probing, 'count': self.count, 'capacity': self.capacity,
+                'load_factor': self.load_factor(), 'tombstones': self.tombstones,
+                'mean_probe': sum(lengths) / len(lengths) if lengths else 0.0,
+                'max_probe': max(lengths, default=0),
+                'clusters': len(clusters),
+                'mean_cluster': sum(clusters) / len(clusters) if clusters else 0.0,
+                'max_cluster': max(clusters, default=0)}
+
+    def _probe_length(self, ix):
+        """[summary]
+        Returns the no. of slots the current index probes to reach entry ix
+        """
+        h = self.hashes[ix]
+        pos = h % self.capacity
+        step = self.probe_step(h)
+        length = 1
+        while self.indices[pos] != ix:
+            pos = self.rehash(pos, step=step)
+            if self.probing == 'quadratic':
+                step += 1
+            length += 1
+        return length
+
+    def _next_capacity(self, n):
+        """[summary]
+        Returns the table size to use for about n slots under the probing strategy
+        """
+        return _next_power_of_two(n) if self.probing == 'quadratic' else _next_prime(n)
+
+    def _distance(self, pos, ix, capacity):
+        """[summary]
+        Robin Hood: how far entry ix stored at pos sits from its home slot
+        """
+        return (pos - self.hashes[ix] % capacity) % capacity
+
+    def _backward_shift(self, pos):
+        """[summary]
+        Robin Hood deletion: empties pos, then moves each following displaced entry back one slot
+        """
+        indices = self.indices
+        nxt = self.rehash(pos)
+        while indices[nxt] >= 0 and self._distance(nxt, indices[nxt], self.capacity) > 0:
+            indices[pos] = indices[nxt]
+            pos = nxt
+            nxt = self.rehash(nxt)
+        indices[pos] = EMPTY
+
+    def _place(self, ix):
+        """[summary]
+        Puts entry ix (whose key is not in the current index) into the current index
+        with the probing strategy
+        """
+        if self.probing == 'robin_hood':
+            self._place_robin_hood(ix)
+            return
+        indices = self.indices
+        h = self.hashes[ix]
+        next_hval = h % self.capacity  # re-hashed value
+        step = self.probe_step(h)
+        # rehash until an EMPTY slot, or a DUMMY one to reuse
+        while indices[next_hval] >= 0:
+            # for debugging
+            if self.verbose:
+                print(f"current pos = {next_hval}, rehashing to = {self.rehash(next_hval, step=step)}")
+            next_hval = self.rehash(next_hval, step=step)
+            if self.probing == 'quadratic':
+                step += 1
+        if indices[next_hval] == DUMMY:
+            self.tombstones -= 1
+        indices[next_hval] = ix
+
+    def _place_robin_hood(self, ix):
+        """[summary]
+        Robin Hood insert: linear probing where the incoming entry takes the slot of any
+        resident closer to its home slot, and carries the evicted resident onwards
+        """
+        indices = self.indices
+        pos = self.hashes[ix] % self.capacity
+        dist = 0  # how far the carried entry is from its home slot
+        while indices[pos] != EMPTY:
+            resident_dist = self._distance(pos, indices[pos], self.capacity)
+            if resident_dist < dist:
+                indices[pos], ix = ix, indices[pos]
+                dist = resident_dist
+            if self.verbose:
+                print(f"current pos = {pos}, rehashing to = {self.rehash(pos)}")
+            pos = self.rehash(pos)
+            dist += 1
+        indices[pos] = ix
+
+    def _find(self, indices, capacity, key, h):
+        """[summary]
+        Returns the slot of the given index array that points at key (full hash h), or -1
+        """
+        hashes, entry_keys = self.hashes, self.entry_keys
+        pos = h % capacity  # initial slot for hash val
+        step = self.probe_step(h, capacity)
+        dist = 0
+        # probe until either 
+        # 1. the key is found (cheap hash comparison first) or 
+        # 2. a never-used slot (EMPTY) is reached: the key would have been placed there
+        # (the load factor guarantees such a slot exists) or
+        # 3. (Robin Hood) a resident closer to its home slot than we are to ours
+        while indices[pos] != EMPTY:
+            ix = indices[pos]
+            if ix >= 0:
+                if hashes[ix] == h and (entry_keys[ix] is key or entry_keys[ix] == key):
+                    return pos
+                if self.probing == 'robin_hood' and self._distance(pos, ix, capacity) < dist:
+                    return -1
+            pos = self.rehash(pos, capacity, step)
+            if self.probing == 'quadratic':
+                step += 1
+            dist += 1
+        return -1
+
+    def _resize(self, new_capacity, compact=None):
+        """[summary]
+        Rebuilds the index with new_capacity slots, all at once or (incremental mode)
+        a few slots per later operation. Removed entries are squeezed out of the dense
+        lists on a full rebuild (compact=None), or whenever compact=True.
+        """
+        # a previous incremental rehash must be finished first
+        while self.old_indices is not None:
+            self._migrate_step(self.old_capacity)
+        if compact is None:
+            compact = not self.incremental
+        if self.verbose:
+            print(f"resizing {self.capacity} -> {new_capacity}")
+        if compact and self.deleted:
+            live = [i for i, key in enumerate(self.entry_keys) if key is not _TOMBSTONE]
+            self.hashes = [self.hashes[i] for i in live]
+            self.entry_keys = [self.entry_keys[i] for i in live]
+            self.entry_vals = [self.entry_vals[i] for i in live]
+            self.deleted = 0
+        if compact:
+            # entry numbers changed (or a full rebuild was asked for): index every entry now
+            self.capacity = new_capacity
+            self.tombstones = 0
+            self.indices = _make_index(max(new_capacity, len(self.entry_keys)), new_capacity)
+            for ix, key in enumerate(self.entry_keys):
+                if key is not _TOMBSTONE:
+                    self._place(ix)
+            return
+        self.old_indices, self.old_capacity = self.indices, self.capacity
+        self.migrate_pos = 0
+        self.capacity = new_capacity
+        self.tombstones = 0
+        # entries are not squeezed here, so the typecode must hold every entry number
+        self.indices = _make_index(max(new_capacity, len(self.entry_keys)), new_capacity)
+
+    def _migrate_step(self, n_slots=None):
+        """[summary]
+        Moves the entries referenced by the next n_slots old index slots (default rehash_step) into the current index
+        """
+        if self.old_indices is None:
+            return
+        stop = min(self.migrate_pos + (n_slots or self.rehash_step), self.old_capacity)
+        for pos in range(self.migrate_pos, stop):
+            ix = self.old_indices[pos]
+            if ix >= 0:
+                self._place(ix)
+                self.old_indices[pos] = DUMMY
+        self.migrate_pos = stop
+        if stop == self.old_capacity:
+            self.old_indices = None
+            self.old_capacity = 0
                 
 if __name__ == "__main__":
     ht = HashTable(capacity=5, verbose=True)
@@ -185,4 +698,39 @@ if __name__ == "__main__":
     ht.remove("Hog")
     print("After removing 'Hog' > ", ht)
     ht.remove("Hog")
-    print(f"len(hashmap) = {len(ht)}")
\ No newline at end of file
+    print(f"len(hashmap) = {len(ht)}")
+
+    ############## Probing strategies: probe lengths per key distribution ################
+    print("\nprobe statistics after bulk insert")
+    for name, keys in (("sequential ints", range(0, 30000, 3)),
+                       ("similar strings", [f"user:{i}" for i in range(10000)])):
+        for probing in PROBING:
+            table = HashTable(probing=probing)
+            for key in keys:
+                table.insert(key, 0)
+            st = table.stats()
+            print(f"{name:<16} {probing:<11} mean_probe={st['mean_probe']:.2f} "
+                  f"max_probe={st['max_probe']:<3} max_cluster={st['max_cluster']}")
+
+    # double hashing on a non-prime capacity: steps sharing a factor with it used to
+    # cycle through a few slots forever (capacity 10, 130 probes 0, 5, 0, ...)
+    table = HashTable(capacity=10, probing='double')
+    table.insert(40, 0)
+    table.insert(45, 0)
+    table.insert(130, 1)
+    assert table.capacity == 11 and table.get(130, 'miss') == 1 and table.get(140, 'miss') == 'miss'
+
+    ############## Benchmark: insert latency while growing ################
+    import time
+    n = 200000
+    print(f"\ninserting {n} keys (seconds per insert)")
+    for incremental in (False, True):
+        table = HashTable(incremental=incremental)
+        samples = []
+        for i in range(n):
+            start = time.perf_counter()
+            table.insert(i, i)
+            samples.append(time.perf_counter() - start)
+        samples.sort()
+        print(f"incremental={incremental!s:<5} p50={samples[n//2]:.2e} "
+              f"p99={samples[int(n*0.99)]:.2e} max={samples[-1]:.2e}")
\ No newline at end of file
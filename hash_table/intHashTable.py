@@ -0,0 +1,351 @@
+"""[summary]
+Hash table specialized for 64-bit integer keys and numeric values
+
+Instead of boxed Python objects in lists, every slot lives in typed arrays:
+- slot_keys: array('q') of int64 keys
+- slot_vals: array('d') (or 'q') of values
+- slot_flags: array('b') of EMPTY / USED / DELETED markers
+so an entry costs ~17 bytes per slot (vs. ~100+ bytes for boxed keys, values and pointers).
+
+Hashing: Python's hash(i) == i, which clusters badly for sequential keys under linear
+probing; keys are scrambled with the splitmix64 finalizer and masked to a power-of-two capacity.
+
+insert_many(keys, vals) / get_many(keys) hash and probe whole NumPy batches at once:
+every round advances all unresolved keys by one slot with vectorized operations.
+
+splitmix64 Reference: https://prng.di.unimi.it/splitmix64.c
+"""
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # batch methods fall back to per-key loops
+    np = None
+
+EMPTY = 0
+USED = 1
+DELETED = 2  # tombstone: probes continue past it
+_MASK64 = (1 << 64) - 1
+
+def _mix(key):
+    """[summary]
+    splitmix64 finalizer: scrambles the bits of a 64-bit integer
+    """
+    k = key & _MASK64
+    k = ((k ^ (k >> 30)) * 0xbf58476d1ce4e5b9) & _MASK64
+    k = ((k ^ (k >> 27)) * 0x94d049bb133111eb) & _MASK64
+    return k ^ (k >> 31)
+
+def _mix_many(keys):
+    """[summary]
+    Vectorized _mix over an int64 NumPy array (uint64 arithmetic wraps like & _MASK64)
+    """
+    k = keys.astype(np.uint64)
+    k = (k ^ (k >> np.uint64(30))) * np.uint64(0xbf58476d1ce4e5b9)
+    k = (k ^ (k >> np.uint64(27))) * np.uint64(0x94d049bb133111eb)
+    return k ^ (k >> np.uint64(31))
+
+class IntHashTable(object):
+    """[summary]
+    Open-addressing (linear probing) hash table with int64 keys and typed values
+
+    -insert(key,val), get(key), remove(key), len(), in  -- same surface as HashTable
+    -insert_many(keys, vals), get_many(keys) -- batch versions, vectorized with NumPy
+    -keys(), values(), items() -- iterate in slot order
+    """
+    def __init__(self, capacity=16, max_load=0.75, min_load=0.125, max_tombstones=0.2,
+                 value_typecode='d'):
+        """[summary]
+        Initialize the table
+        """
+        if not 0 < max_load < 1 or not 0 <= min_load < max_load/2:
+            raise ValueError("need 0 < max_load < 1 and 0 <= min_load < max_load/2")
+        if value_typecode not in ('d', 'q'):
+            raise ValueError("value_typecode must be 'd' or 'q'")
+        self.value_typecode = value_typecode
+        self.max_load = max_load
+        self.min_load = min_load
+        self.max_tombstones = max_tombstones
+        self.capacity = 1 << max(capacity - 1, 1).bit_length()  # power of two
+        self.min_capacity = self.capacity
+        self.count = 0  # number of key,val pairs present
+        self.tombstones = 0  # no. of DELETED slots
+        self._alloc(self.capacity)
+
+    def __str__(self):
+        """[summary]
+        Returns string representation
+        """
+        return str([[key, val] for key, val in self.items()])
+
+    def __len__(self):
+        """[summary]
+        Returns the size of the entry
+        """
+        return self.count
+
+    def __getitem__(self, key):
+        """[summary]
+        Allow access using "[]"
+        """
+        return self.get(key)
+
+    def __setitem__(self, key, val):
+        """[summary]
+        Allow access using "[]"
+        """
+        self.insert(key, val)
+
+    def __contains__(self, key):
+        """[summary]
+        Allow "key in table"
+        """
+        return self._find(key) != -1
+
+    def keys(self):
+        """[summary]
+        Generator over the keys
+        """
+        return (key for key, flag in zip(self.slot_keys, self.slot_flags) if flag == USED)
+
+    def values(self):
+        """[summary]
+        Generator over the values
+        """
+        return (val for val, flag in zip(self.slot_vals, self.slot_flags) if flag == USED)
+
+    def items(self):
+        """[summary]
+        Generator over the (key, value) pairs
+        """
+        return ((key, val) for key, val, flag in zip(self.slot_keys, self.slot_vals, self.slot_flags)
+                if flag == USED)
+
+    def load_factor(self):
+        """[summary]
+        Returns count/capacity
+        """
+        return self.count / self.capacity
+
+    def nbytes(self):
+        """[summary]
+        Returns the bytes held by the slot arrays
+        """
+        return sum(a.itemsize * len(a) for a in (self.slot_keys, self.slot_vals, self.slot_flags))
+
+    def insert(self, key, val):
+        """[summary]
+        Inserts the key:value pair into the table, replacing the value of an existing key
+        """
+        if (self.count + self.tombstones + 1) > self.max_load * self.capacity:
+            # grow if the live pairs need it, else just rebuild without tombstones
+            if (self.count + 1) > self.max_load * self.capacity / 2:
+                self._resize(2 * self.capacity)
+            else:
+                self._resize(self.capacity)
+        keys, flags, mask = self.slot_keys, self.slot_flags, self.capacity - 1
+        pos = _mix(key) & mask
+        first_tombstone = -1
+        while flags[pos] != EMPTY:
+            if flags[pos] == DELETED:
+                if first_tombstone == -1:
+                    first_tombstone = pos  # reusable, but the key may still be further on
+            elif keys[pos] == key:
+                self.slot_vals[pos] = val  # replace
+                return
+            pos = (pos + 1) & mask
+        if first_tombstone != -1:
+            pos = first_tombstone
+            self.tombstones -= 1
+        keys[pos] = key
+        self.slot_vals[pos] = val
+        flags[pos] = USED
+        self.count += 1
+
+    def get(self, key):
+        """[summary]
+        Get item with the provided key, if it exits
+        """
+        pos = self._find(key)
+        if pos == -1:
+            print("Key Error: provided key does not exist!")
+            return -1 # not found
+        return self.slot_vals[pos]
+
+    def remove(self, key):
+        """[summary]
+        With the provided key, remove the item from the hash table
+        """
+        pos = self._find(key)
+        if pos == -1:
+            print(f"Key Error: '{key}' does not exist!")
+            return -1 # not found
+        self.slot_flags[pos] = DELETED
+        self.tombstones += 1
+        self.count -= 1
+        if self.count < self.min_load * self.capacity and self.capacity > self.min_capacity:
+            self._resize(self.capacity // 2)
+        elif self.tombstones > self.max_tombstones * self.capacity:
+            self._resize(self.capacity)  # compact: rebuild without tombstones
+
+    def insert_many(self, keys, vals):
+        """[summary]
+        Inserts every keys[i]:vals[i] pair; for repeated keys the last pair wins
+        """
+        if np is None:
+            for key, val in zip(keys, vals):
+                self.insert(key, val)
+            return
+        keys = np.asarray(keys, dtype=np.int64)
+        vals = np.asarray(vals, dtype=self.value_typecode)
+        if len(keys) != len(vals):
+            raise ValueError("keys and vals must have the same length")
+        # keep the last occurrence of each key, like repeated insert() calls
+        _, last = np.unique(keys[::-1], return_index=True)
+        last = len(keys) - 1 - last
+        keys, vals = keys[last], vals[last]
+        # make room as if every key were new, so no resize happens mid-batch
+        needed = self.count + self.tombstones + len(keys)
+        if needed > self.max_load * self.capacity:
+            new_capacity = self.capacity
+            while self.count + len(keys) > self.max_load * new_capacity:
+                new_capacity *= 2
+            self._resize(new_capacity)
+        self._insert_batch(keys, vals)
+
+    def get_many(self, keys, default=-1):
+        """[summary]
+        Returns a NumPy array with the value of every key (default where the key is missing)
+        """
+        if np is None:
+            return [self.slot_vals[pos] if pos != -1 else default
+                    for pos in map(self._find, keys)]
+        keys = np.asarray(keys, dtype=np.int64)
+        out = np.full(len(keys), default, dtype=self.value_typecode)
+        slot_keys, slot_vals, flags = self._views()
+        mask = self.capacity - 1
+        pos = (_mix_many(keys) & np.uint64(mask)).astype(np.int64)
+        pending = np.arange(len(keys))
+        # each round, every unresolved key looks at its next slot
+        while pending.size:
+            p = pos[pending]
+            f = flags[p]
+            hit = (f == USED) & (slot_keys[p] == keys[pending])
+            out[pending[hit]] = slot_vals[p[hit]]
+            go_on = ~hit & (f != EMPTY)  # EMPTY ends the probe: a miss
+            pos[pending[go_on]] = (p[go_on] + 1) & mask
+            pending = pending[go_on]
+        return out
+
+    def _find(self, key):
+        """[summary]
+        Returns the slot holding key, or -1
+        """
+        keys, flags, mask = self.slot_keys, self.slot_flags, self.capacity - 1
+        pos = _mix(key) & mask
+        # probe until the key or a never-used (EMPTY) slot
+        while flags[pos] != EMPTY:
+            if flags[pos] == USED and keys[pos] == key:
+                return pos
+            pos = (pos + 1) & mask
+        return -1
+
+    def _alloc(self, capacity):
+        """[summary]
+        Allocates zeroed slot arrays (flag 0 == EMPTY)
+        """
+        self.slot_keys = array('q', bytes(8 * capacity))
+        self.slot_vals = array(self.value_typecode, bytes(8 * capacity))
+        self.slot_flags = array('b', bytes(capacity))
+
+    def _views(self):
+        """[summary]
+        NumPy views sharing the slot arrays' memory
+        """
+        return (np.frombuffer(self.slot_keys, dtype=np.int64),
+                np.frombuffer(self.slot_vals, dtype=self.value_typecode),
+                np.frombuffer(self.slot_flags, dtype=np.int8))
+
+    def _insert_batch(self, keys, vals):
+        """[summary]
+        Vectorized insert of distinct keys; the table must already have room for all of them
+        """
+        slot_keys, slot_vals, flags = self._views()
+        mask = self.capacity - 1
+        pos = (_mix_many(keys) & np.uint64(mask)).astype(np.int64)
+        pending = np.arange(len(keys))
+        while pending.size:
+            p = pos[pending]
+            f = flags[p]
+            k = keys[pending]
+            # existing key: replace the value
+            hit = (f == USED) & (slot_keys[p] == k)
+            slot_vals[p[hit]] = vals[pending[hit]]
+            # EMPTY slot: the first key aiming at it takes it, the others retry next round
+            empty = np.flatnonzero(f == EMPTY)
+            slots, first = np.unique(p[empty], return_index=True)
+            winners = pending[empty[first]]
+            slot_keys[slots] = keys[winners]
+            slot_vals[slots] = vals[winners]
+            flags[slots] = USED
+            self.count += len(winners)
+            done = hit
+            done[empty[first]] = True
+            # USED by another key or DELETED: move on to the next slot
+            step = ~hit & (f != EMPTY)
+            pos[pending[step]] = (p[step] + 1) & mask
+            pending = pending[~done]
+
+    def _resize(self, new_capacity):
+        """[summary]
+        Moves every pair into fresh slot arrays of new_capacity slots
+        """
+        used = [pos for pos, flag in enumerate(self.slot_flags) if flag == USED]
+        old_keys, old_vals = self.slot_keys, self.slot_vals
+        self.capacity = new_capacity
+        self.count = 0
+        self.tombstones = 0
+        self._alloc(new_capacity)
+        if np is not None:
+            used = np.array(used, dtype=np.int64)
+            self._insert_batch(np.frombuffer(old_keys, dtype=np.int64)[used],
+                               np.frombuffer(old_vals, dtype=self.value_typecode)[used])
+        else:
+            for pos in used:
+                self.insert(old_keys[pos], old_vals[pos])
+
+if __name__ == "__main__":
+    import sys
+    import time
+    from hashTable import HashTable
+
+    it = IntHashTable()
+    for i in range(5):
+        it.insert(i, i * 1.5)
+    print(it)
+    print(f"it[3] = {it[3]}, 7 in it = {7 in it}")
+    it.remove(3)
+    print("After removing 3 > ", it)
+
+    ############## Benchmark: memory and batch throughput ################
+    n = 1000000
+    keys = list(range(0, 3 * n, 3))
+    vals = [float(k) for k in keys]
+
+    ht = HashTable()
+    start = time.perf_counter()
+    for key, val in zip(keys, vals):
+        ht.insert(key, val)
+    print(f"\nHashTable     {n} inserts: {time.perf_counter() - start:.2f}s")
+    boxed = sum(sys.getsizeof(obj) for obj in (ht.indices, ht.hashes, ht.entry_keys, ht.entry_vals))
+    boxed += sum(sys.getsizeof(key) + sys.getsizeof(val) for key, val in zip(keys, vals))
+    print(f"HashTable     ~{boxed / 2**20:.0f} MB")
+
+    it = IntHashTable()
+    start = time.perf_counter()
+    it.insert_many(keys, vals)
+    print(f"IntHashTable  {n} insert_many: {time.perf_counter() - start:.2f}s")
+    print(f"IntHashTable  {it.nbytes() / 2**20:.0f} MB")
+    start = time.perf_counter()
+    found = it.get_many(keys)
+    print(f"IntHashTable  {n} get_many: {time.perf_counter() - start:.2f}s, all found = {bool((found == vals).all())}")
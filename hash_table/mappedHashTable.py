@@ -0,0 +1,289 @@
+"""[summary]
+On-disk snapshot of a HashTable, served read-only straight from a memory-mapped file
+
+HashTable.save(path) writes the snapshot, HashTable.open(path, mmap=True) maps it.
+Lookups probe the slots inside the mapping and only unpickle the value that was asked
+for, so opening is O(1) regardless of size and every process that maps the same file
+shares one copy of it in the page cache.
+
+File layout (version 1, little-endian):
+   [header: 64 bytes][slots: capacity x 16 bytes][records, in insertion order]
+   header = magic (8 bytes) | version (uint32) | padding | count (uint64 at offset 16)
+            | capacity (uint64 at offset 24) | records offset (uint64 at offset 32)
+   slot = stable hash of the key (uint64) | record offset (uint64, 0 = empty)
+   record = key length (uint32) | value length (uint32) | key bytes | pickled value
+
+- open addressing with linear probing over a power-of-two capacity, at most half full
+- hash() of str/bytes is salted per process (PYTHONHASHSEED), so slots use a stable
+  64-bit blake2b of the encoded key instead
+- keys are encoded as str (utf-8), bytes, int, or else pickled; a lookup matches the
+  encoded bytes, so keys that are == but of different types (1, 1.0, True) do not match
+- values are pickled, so a snapshot must only be opened from a trusted source
+"""
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+
+MAGIC = b'HASHTB\x00\x00'
+VERSION = 1
+HEADER_SIZE = 64
+_HEADER = struct.Struct('<8sI4xQQQ')  # magic, version, count, capacity, records offset
+_SLOT = struct.Struct('<QQ')  # stable hash, record offset
+_RECORD = struct.Struct('<II')  # key length, value length
+_PICKLE_PROTOCOL = 4
+_MISSING = object()  # get() without a default
+
+def encode_key(key):
+    """[summary]
+    Returns the bytes a key is stored (and looked up) as, tagged with its type
+    """
+    if type(key) is str:
+        return b's' + key.encode('utf-8', 'surrogatepass')
+    if type(key) is bytes:
+        return b'b' + key
+    if type(key) is int:
+        return b'i' + str(key).encode()
+    return b'p' + pickle.dumps(key, _PICKLE_PROTOCOL)
+
+def decode_key(data):
+    """[summary]
+    Inverse of encode_key
+    """
+    tag, body = data[:1], data[1:]
+    if tag == b's':
+        return body.decode('utf-8', 'surrogatepass')
+    if tag == b'b':
+        return body
+    if tag == b'i':
+        return int(body)
+    return pickle.loads(body)
+
+def stable_hash(encoded):
+    """[summary]
+    64-bit hash of an encoded key, the same in every process
+    """
+    return int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), 'little')
+
+def write_snapshot(path, items):
+    """[summary]
+    Writes (key, value) pairs to path in the snapshot format. The file is written next
+    to path and renamed over it, so processes still mapping an older snapshot keep
+    reading that one.
+    """
+    records = []
+    for key, val in items:
+        encoded = encode_key(key)
+        records.append((stable_hash(encoded), encoded, pickle.dumps(val, _PICKLE_PROTOCOL)))
+    count = len(records)
+    capacity = 1 << max(2 * count, 8).bit_length()  # load factor below 1/2
+    mask = capacity - 1
+    records_offset = HEADER_SIZE + capacity * _SLOT.size
+    slots = bytearray(capacity * _SLOT.size)
+    offset = records_offset
+    for h, encoded, pickled in records:
+        pos = h & mask
+        while _SLOT.unpack_from(slots, pos * _SLOT.size)[1]:
+            pos = (pos + 1) & mask  # keys are unique (they come from a HashTable)
+        _SLOT.pack_into(slots, pos * _SLOT.size, h, offset)
+        offset += _RECORD.size + len(encoded) + len(pickled)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        header = _HEADER.pack(MAGIC, VERSION, count, capacity, records_offset)
+        f.write(header + bytes(HEADER_SIZE - len(header)))
+        f.write(slots)
+        for _, encoded, pickled in records:
+            f.write(_RECORD.pack(len(encoded), len(pickled)))
+            f.write(encoded)
+            f.write(pickled)
+    os.replace(tmp_path, path)
+
+class MappedHashTable(object):
+    """[summary]
+    Read-only HashTable view of a snapshot file
+
+    -get(key, default), [], in, len() -- lookups probe the mapped slots
+    -keys(), values(), items() -- iterate in the saved insertion order
+    -close() -- unmap the file (also on "with" exit)
+    -insert()/remove() raise PermissionError
+    """
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # an empty file cannot be mapped
+            self._file.close()
+            raise ValueError(f"'{path}' is not a HashTable snapshot")
+        magic, version, count, capacity, records_offset = _check_header(self._mm, path)
+        self.count = count
+        self.capacity = capacity
+        self._mask = capacity - 1
+        self._records_offset = records_offset
+        # zero-copy: slot i is (self._slots[2*i], self._slots[2*i+1]) (little-endian hosts)
+        self._slots = memoryview(self._mm)[HEADER_SIZE:records_offset].cast('Q')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def __str__(self):
+        return str([[key, val] for key, val in self.items()])
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def __contains__(self, key):
+        return self._find(key) != 0
+
+    def __iter__(self):
+        return self.keys()
+
+    def keys(self):
+        """[summary]
+        Generator over the keys in insertion order
+        """
+        return (key for key, _ in self._records(values=False))
+
+    def values(self):
+        """[summary]
+        Generator over the values in insertion order
+        """
+        return (val for _, val in self._records())
+
+    def items(self):
+        """[summary]
+        Generator over the (key, value) pairs in insertion order
+        """
+        return self._records()
+
+    def get(self, key, default=_MISSING):
+        """[summary]
+        Get item with the provided key, if it exists
+        (a missing key returns default if one is given, else reports and returns -1)
+        """
+        offset = self._find(key)
+        if offset == 0:
+            if default is not _MISSING:
+                return default
+            print("Key Error: provided key does not exist!")
+            return -1 # not found
+        key_len, val_len = _RECORD.unpack_from(self._mm, offset)
+        start = offset + _RECORD.size + key_len
+        return pickle.loads(self._mm[start:start + val_len])
+
+    def insert(self, key, val):
+        raise PermissionError(f"'{self.path}' is a read-only snapshot")
+
+    def remove(self, key):
+        raise PermissionError(f"'{self.path}' is a read-only snapshot")
+
+    __setitem__ = insert
+
+    def close(self):
+        """[summary]
+        Unmaps and closes the file; the table is unusable afterwards
+        """
+        if getattr(self, "_slots", None) is not None:
+            self._slots.release()
+            self._slots = None
+        if getattr(self, "_mm", None) is not None:
+            self._mm.close()
+            self._mm = None
+        if getattr(self, "_file", None) is not None:
+            self._file.close()
+            self._file = None
+
+    def _find(self, key):
+        """[summary]
+        Returns the record offset of key, or 0 if it is not in the snapshot
+        """
+        encoded = encode_key(key)
+        h = stable_hash(encoded)
+        slots, mm = self._slots, self._mm
+        pos = h & self._mask
+        # probe until the key is found or an empty slot (offset 0) is reached
+        while True:
+            offset = slots[2*pos + 1]
+            if offset == 0:
+                return 0
+            if slots[2*pos] == h:
+                key_len = _RECORD.unpack_from(mm, offset)[0]
+                start = offset + _RECORD.size
+                if key_len == len(encoded) and mm[start:start + key_len] == encoded:
+                    return offset
+            pos = (pos + 1) & self._mask
+
+    def _records(self, values=True):
+        """[summary]
+        Generator over the records in file (insertion) order
+        """
+        mm = self._mm
+        offset = self._records_offset
+        for _ in range(self.count):
+            key_len, val_len = _RECORD.unpack_from(mm, offset)
+            start = offset + _RECORD.size
+            key = decode_key(mm[start:start + key_len])
+            start += key_len
+            yield key, (pickle.loads(mm[start:start + val_len]) if values else None)
+            offset = start + val_len
+
+def _check_header(buf, path):
+    """[summary]
+    Returns the unpacked header of a snapshot, or raises ValueError
+    """
+    if len(buf) < HEADER_SIZE or buf[:8] != MAGIC:
+        raise ValueError(f"'{path}' is not a HashTable snapshot")
+    header = _HEADER.unpack_from(buf)
+    if header[1] != VERSION:
+        raise ValueError(f"'{path}' is snapshot version {header[1]}, expected {VERSION}")
+    return header
+
+def read_snapshot(path):
+    """[summary]
+    Generator over the (key, value) pairs of a snapshot file, read into memory
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    _, _, count, _, offset = _check_header(data, path)
+    for _ in range(count):
+        key_len, val_len = _RECORD.unpack_from(data, offset)
+        start = offset + _RECORD.size
+        key = decode_key(data[start:start + key_len])
+        start += key_len
+        yield key, pickle.loads(data[start:start + val_len])
+        offset = start + val_len
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    from hashTable import HashTable
+
+    path = os.path.join(tempfile.mkdtemp(), "demo.htsnap")
+    ht = HashTable.from_items((f"user:{i}", {"id": i}) for i in range(100000))
+    ht["Age"] = 5
+    ht.save(path)
+    print(f"saved {len(ht)} keys, {os.path.getsize(path)} bytes")
+
+    start = time.perf_counter()
+    with HashTable.open(path) as snap:
+        print(f"mapped in {time.perf_counter() - start:.6f}s, len = {len(snap)}")
+        print(snap["Age"], snap["user:42"], "user:100000" in snap)
+        try:
+            snap["Age"] = 6
+        except PermissionError as e:
+            print("insert on snapshot:", e)
+
+    start = time.perf_counter()
+    loaded = HashTable.open(path, mmap=False)
+    print(f"loaded into a HashTable in {time.perf_counter() - start:.3f}s, len = {len(loaded)}")
@@ -0,0 +1,329 @@
+"""[summary]
+Approximate membership filters: "is key in the set?" answered in a few bits per key
+
+- "no" is always right, "yes" is wrong with probability ~fp_rate (a false positive)
+- usable standalone (e.g. dedup: "if key not in f: f.add(key)") or attached to a HashTable
+  (table.attach_filter(f)) so that a get() / in of an absent key usually returns without
+  walking a probe chain
+- add(key) / in / discard(key) hash the key with the stable hash of mappedHashTable
+  (not the per-process salted hash()), so to_bytes() / from_bytes() round-trip across
+  processes and machines; that hash tells keys apart by type (1, 1.0 and True differ)
+- add_hash(h) / contains_hash(h) / discard_hash(h) take a hash() value instead: that is
+  what HashTable feeds an attached filter, consistent with its own hash() / == lookups
+  (only valid within one process, and not to be mixed with the key methods in one filter)
+
+Bloom filter: m bits, k bit positions per key, g_i = h1 + i*h2 (Kirsch-Mitzenmacher)
+- m = -n ln(p) / ln(2)^2, k = m/n ln(2) for capacity n and fp_rate p
+- no deletion: discard() is a no-op, a removed key may still answer "yes"
+
+Cuckoo filter: power-of-two number of buckets of BUCKET_SIZE fingerprints
+- a key's fingerprint lives in bucket i1 = hash or i2 = i1 ^ hash(fingerprint), so either
+  bucket can be found from the other when a fingerprint is kicked out to make room
+- fingerprint bits f = log2(2 * BUCKET_SIZE / p), stored in the smallest array typecode
+- supports discard(key) of a key that was added; add() returns False once full
+
+Reference: Fan et al., "Cuckoo Filter: Practically Better Than Bloom" (CoNEXT 2014)
+"""
+import math
+import random
+import struct
+from array import array
+
+from mappedHashTable import encode_key, stable_hash
+
+_MASK32 = (1 << 32) - 1
+_MASK64 = (1 << 64) - 1
+_MURMUR_M = 0x5bd1e995  # scrambles a fingerprint into a bucket offset
+BUCKET_SIZE = 4
+MAX_KICKS = 500
+_HEADER = struct.Struct('<4sQdQQ')  # magic, capacity, fp_rate, size, first parameter
+
+def _key_hashes(key):
+    """[summary]
+    Two 32-bit hashes of a key, stable across processes (h2 odd, never 0)
+    """
+    h = stable_hash(encode_key(key))
+    return h & _MASK32, (h >> 32) | 1
+
+def _table_hashes(h):
+    """[summary]
+    Two 32-bit hashes of a hash() value, mixed with the splitmix64 finalizer first
+    (hash() of a small int is the int itself)
+    """
+    h &= _MASK64
+    h = ((h ^ (h >> 30)) * 0xbf58476d1ce4e5b9) & _MASK64
+    h = ((h ^ (h >> 27)) * 0x94d049bb133111eb) & _MASK64
+    h ^= h >> 31
+    return h & _MASK32, (h >> 32) | 1
+
+class BloomFilter(object):
+    """[summary]
+    Bloom filter over a bytearray of n_bits bits
+
+    -add(key), in, len() (number of add() calls), discard(key) (no-op)
+    -add_hash(h), contains_hash(h), discard_hash(h) (no-op) for hash() values
+    -to_bytes(), BloomFilter.from_bytes(data)
+    """
+    MAGIC = b'BLM1'
+
+    def __init__(self, capacity=1000, fp_rate=0.01):
+        if capacity < 1 or not 0 < fp_rate < 1:
+            raise ValueError("need capacity >= 1 and 0 < fp_rate < 1")
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.n_bits = max(8, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.n_hashes = max(1, round(self.n_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.n_bits + 7) // 8)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        return self._contains(*_key_hashes(key))
+
+    def contains_hash(self, h):
+        return self._contains(*_table_hashes(h))
+
+    def add(self, key):
+        """[summary]
+        Sets the key's bits; always succeeds (returns True), the fp rate rises past capacity
+        """
+        return self._add(*_key_hashes(key))
+
+    def add_hash(self, h):
+        return self._add(*_table_hashes(h))
+
+    def _contains(self, h1, h2):
+        bits, n_bits = self.bits, self.n_bits
+        for i in range(self.n_hashes):
+            pos = (h1 + i * h2) % n_bits
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def _add(self, h1, h2):
+        bits, n_bits = self.bits, self.n_bits
+        for i in range(self.n_hashes):
+            pos = (h1 + i * h2) % n_bits
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.size += 1
+        return True
+
+    def discard(self, key):
+        """[summary]
+        Bits may be shared with other keys, so nothing is removed
+        """
+        return False
+
+    discard_hash = discard
+
+    def fill_ratio(self):
+        """[summary]
+        Fraction of bits set; the fp rate is about fill_ratio() ** n_hashes
+        """
+        return sum(bin(b).count('1') for b in self.bits) / self.n_bits
+
+    def to_bytes(self):
+        return _HEADER.pack(self.MAGIC, self.capacity, self.fp_rate, self.size, self.n_hashes) + self.bits
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, capacity, fp_rate, size, n_hashes = _unpack_header(data, cls.MAGIC)
+        f = cls(capacity, fp_rate)
+        if n_hashes != f.n_hashes or len(data) - _HEADER.size != len(f.bits):
+            raise ValueError("corrupt BloomFilter data")
+        f.bits[:] = data[_HEADER.size:]
+        f.size = size
+        return f
+
+class CuckooFilter(object):
+    """[summary]
+    Cuckoo filter with BUCKET_SIZE fingerprints per bucket (0 = empty slot)
+
+    -add(key) (False once full), in, len(), discard(key)
+    -add_hash(h), contains_hash(h), discard_hash(h) for hash() values
+    -to_bytes(), CuckooFilter.from_bytes(data)
+    """
+    MAGIC = b'CKO1'
+
+    def __init__(self, capacity=1000, fp_rate=0.01):
+        if capacity < 1 or not 0 < fp_rate < 1:
+            raise ValueError("need capacity >= 1 and 0 < fp_rate < 1")
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.fp_bits = min(32, max(4, math.ceil(math.log2(2 * BUCKET_SIZE / fp_rate))))
+        # buckets ~95% full at capacity
+        self.n_buckets = 1 << max(1, math.ceil(capacity / (0.95 * BUCKET_SIZE)) - 1).bit_length()
+        self._mask = self.n_buckets - 1
+        typecode = 'B' if self.fp_bits <= 8 else 'H' if self.fp_bits <= 16 else 'L'
+        self.slots = array(typecode, [0]) * (self.n_buckets * BUCKET_SIZE)
+        self.size = 0
+        self.victim = 0  # fingerprint left homeless by a failed add (0 = none)
+        self.victim_bucket = 0
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        return self._contains(*_key_hashes(key))
+
+    def contains_hash(self, h):
+        return self._contains(*_table_hashes(h))
+
+    def add(self, key):
+        """[summary]
+        Stores the key's fingerprint, kicking residents to their other bucket if need be.
+        Returns False (filter unchanged) once full.
+        """
+        return self._add(*_key_hashes(key))
+
+    def add_hash(self, h):
+        return self._add(*_table_hashes(h))
+
+    def discard(self, key):
+        """[summary]
+        Removes one copy of the key's fingerprint; only discard keys that were added
+        (discarding another key with the same fingerprint makes a false negative)
+        """
+        return self._discard(*_key_hashes(key))
+
+    def discard_hash(self, h):
+        return self._discard(*_table_hashes(h))
+
+    def _contains(self, h1, h2):
+        fp, i1 = self._fingerprint(h1, h2)
+        i2 = self._alt_bucket(i1, fp)
+        if self.victim == fp and self.victim_bucket in (i1, i2):
+            return True
+        slots = self.slots
+        return fp in slots[i1 * BUCKET_SIZE:(i1 + 1) * BUCKET_SIZE] or \
+            fp in slots[i2 * BUCKET_SIZE:(i2 + 1) * BUCKET_SIZE]
+
+    def _add(self, h1, h2):
+        if self.victim:
+            return False
+        fp, i1 = self._fingerprint(h1, h2)
+        i2 = self._alt_bucket(i1, fp)
+        if self._put(i1, fp) or self._put(i2, fp):
+            self.size += 1
+            return True
+        bucket = random.choice((i1, i2))
+        for _ in range(MAX_KICKS):
+            # swap with a random resident, which moves on to its alternate bucket
+            slot = bucket * BUCKET_SIZE + random.randrange(BUCKET_SIZE)
+            fp, self.slots[slot] = self.slots[slot], fp
+            bucket = self._alt_bucket(bucket, fp)
+            if self._put(bucket, fp):
+                self.size += 1
+                return True
+        # keep the last evicted fingerprint, so no added key turns into a false negative
+        self.victim, self.victim_bucket = fp, bucket
+        self.size += 1
+        return True
+
+    def _discard(self, h1, h2):
+        fp, i1 = self._fingerprint(h1, h2)
+        i2 = self._alt_bucket(i1, fp)
+        for bucket in (i1, i2):
+            start = bucket * BUCKET_SIZE
+            for slot in range(start, start + BUCKET_SIZE):
+                if self.slots[slot] == fp:
+                    self.slots[slot] = 0
+                    self.size -= 1
+                    self._reinsert_victim()
+                    return True
+        if self.victim == fp and self.victim_bucket in (i1, i2):
+            self.victim = 0
+            self.size -= 1
+            return True
+        return False
+
+    def load_factor(self):
+        return self.size / len(self.slots)
+
+    def to_bytes(self):
+        return _HEADER.pack(self.MAGIC, self.capacity, self.fp_rate, self.size,
+                            self.victim << 32 | self.victim_bucket) + self.slots.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, capacity, fp_rate, size, victim = _unpack_header(data, cls.MAGIC)
+        f = cls(capacity, fp_rate)
+        if len(data) - _HEADER.size != len(f.slots) * f.slots.itemsize:
+            raise ValueError("corrupt CuckooFilter data")
+        f.slots = array(f.slots.typecode)
+        f.slots.frombytes(data[_HEADER.size:])
+        f.size = size
+        f.victim, f.victim_bucket = victim >> 32, victim & _MASK32
+        return f
+
+    def _fingerprint(self, h1, h2):
+        """[summary]
+        Returns the non-zero fingerprint and the first bucket of a key's two hashes
+        """
+        return h2 % ((1 << self.fp_bits) - 1) + 1, h1 & self._mask
+
+    def _alt_bucket(self, bucket, fp):
+        """[summary]
+        The other bucket of a fingerprint (self-inverse, needs a power-of-two n_buckets)
+        """
+        return (bucket ^ (fp * _MURMUR_M)) & self._mask
+
+    def _put(self, bucket, fp):
+        """[summary]
+        Stores fp in a free slot of bucket; returns False if the bucket is full
+        """
+        start = bucket * BUCKET_SIZE
+        for slot in range(start, start + BUCKET_SIZE):
+            if not self.slots[slot]:
+                self.slots[slot] = fp
+                return True
+        return False
+
+    def _reinsert_victim(self):
+        """[summary]
+        After a discard frees a slot, try to give the homeless fingerprint a bucket again
+        """
+        if self.victim:
+            fp, bucket = self.victim, self.victim_bucket
+            if self._put(bucket, fp) or self._put(self._alt_bucket(bucket, fp), fp):
+                self.victim = 0
+
+def _unpack_header(data, magic):
+    """[summary]
+    Returns the unpacked serialization header, or raises ValueError
+    """
+    if len(data) < _HEADER.size or bytes(data[:4]) != magic:
+        raise ValueError(f"not {magic!r} filter data")
+    return _HEADER.unpack_from(data)
+
+if __name__ == "__main__":
+    import time
+
+    from hashTable import HashTable
+
+    n = 20000
+    for cls in (BloomFilter, CuckooFilter):
+        f = cls(capacity=n, fp_rate=0.01)
+        for i in range(n):
+            f.add(f"seen:{i}")
+        assert all(f"seen:{i}" in f for i in range(n))
+        fp = sum(f"new:{i}" in f for i in range(n)) / n
+        g = cls.from_bytes(f.to_bytes())
+        print(f"{cls.__name__:<12} {len(f.to_bytes())} bytes, measured fp rate = {fp:.4f}, "
+              f"round-trip ok = {all(f'seen:{i}' in g for i in range(100))}")
+
+    # negative lookups with and without a filter in front of the table
+    # (sequential ints cluster under linear probing, so misses walk long chains)
+    n = 5000
+    for f in (None, BloomFilter(n), CuckooFilter(n)):
+        table = HashTable()
+        for i in range(n):
+            table.insert(i, i)
+        if f is not None:
+            table.attach_filter(f)
+        start = time.perf_counter()
+        # i + capacity has home slot i, inside the cluster of 0..n-1
+        misses = sum(table.get(i + table.capacity, None) is None for i in range(n))
+        print(f"filter={type(f).__name__:<12} {misses} misses in {time.perf_counter() - start:.3f}s")
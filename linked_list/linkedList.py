@@ -10,7 +10,7 @@ Key Attributes:
 - Extra memory space is required with each element of the list
 - Arrays have better cache locality
 
-implement (I did with tail pointer & without):
+implement (SLinkedList keeps a tail pointer; DLinkedList is doubly linked):
  -size() - returns number of data elements in list
  -empty() - bool returns true if empty
  -value_at(index) - returns the value of the nth item (starting at 0 for first)
@@ -25,24 +25,161 @@ implement (I did with tail pointer & without):
  -value_n_from_end(n) - returns the value of the node at nth position from the end of the list
  -reverse() - reverses the list
  -remove_value(value) - removes the first item in the list with this value
+
+SLinkedList bulk and streaming API:
+ -iter(llist) / for val in llist - generator over the values, O(1) extra memory
+ -extend(iterable), SLinkedList.from_iterable(iterable) - link a batch in one pass
+ -to_list() - values as a Python list
+ -llist.map(fn).filter(pred).take(k) - lazy ListStream stages: each value flows
+  through the whole pipeline before the next node is read, nothing is materialized
+  until to_list() / to_linked_list() / iteration
+
+SLinkedList sorting and merging (nodes are relinked, never copied):
+ -sort(key=None) - stable bottom-up merge sort, O(n log n) time, O(1) extra memory
+ -merge_sorted(other, key=None) - merges sorted other into this sorted list, emptying other
+ -merge_k_sorted(lists, key=None) - one sorted list from k sorted lists via a heap of
+  their k front nodes, O(n log k) time, O(k) extra memory; the inputs are emptied
+
+SLinkedList positional access near the last position:
+ -value_at, insert, delete and value_n_from_end remember the last node they reached
+  (the finger) and resume from it when the next index is at or after it, so
+  value_at(0), value_at(1), ... is O(n) overall instead of O(n^2)
+ -cursor(index) - ListCursor at a node: value, seek(index), advance(k),
+  insert_after(value), remove_after() in O(1) (+ the distance moved)
+ -structural changes (anything but push_back / extend) bump a version number, which
+  drops the finger and makes other cursors raise RuntimeError
+
+Time (SLinkedList / DLinkedList):
+ -push_front, pop_front, front, push_back, back: O(1) / O(1)
+ -pop_back: O(n) (the new tail is found from head) / O(1)
+ -remove_node(node) (DLinkedList, node returned by push_*/insert): O(1)
+ -value_at, insert, delete: O(n) / O(min(index, n - index))
+
+Memory:
+ -nodes use __slots__ (no per-node __dict__): 48 bytes per Node instead of ~90
+  (more before Python 3.11), on top of the value itself
+ -pass pool=NodePool() to recycle removed nodes instead of allocating new ones;
+  a pool may be shared by several lists of the same node type
 """
+import heapq
+import itertools
+
 class Node:
     """
     Node class for linked list w/ value(key) and next pointer (next)
     val = key value
     next = pointer to the next node
     """
+    __slots__ = ('val', 'next')
+
     def __init__(self, val=None):
         self.val = val
         self.next = None
 
+class NodePool:
+    """
+    Free list of removed nodes, chained through their next pointers
+    max_size = most nodes kept for reuse (the rest are left to the garbage collector)
+    allocated / reused = nodes created / handed out again by get()
+    """
+    __slots__ = ('node_type', 'max_size', 'free', 'size', 'allocated', 'reused')
+
+    def __init__(self, node_type=None, max_size=1 << 20):
+        self.node_type = node_type or Node
+        self.max_size = max_size
+        self.free = None  # top of the free list
+        self.size = 0
+        self.allocated = 0
+        self.reused = 0
+
+    def get(self, val):
+        """
+        Returns a node holding val, recycled if the free list has one
+        """
+        node = self.free
+        if node is None:
+            self.allocated += 1
+            return self.node_type(val)
+        self.free = node.next
+        node.val = val
+        node.next = None
+        self.size -= 1
+        self.reused += 1
+        return node
+
+    def put(self, node):
+        """
+        Takes back a node that is no longer linked into any list
+        """
+        node.val = None  # do not keep the value alive
+        if self.size >= self.max_size:
+            node.next = None
+            return
+        node.next = self.free
+        self.free = node
+        self.size += 1
+
 class SLinkedList:
     """
     Singly Linked List in Python
     """
-    def __init__(self):
+    def __init__(self, pool=None):
         self.head = None
+        self.tail = None  # last node, so push_back/back need no traversal
         self.n = 0  # initialize with zero size
+        self.pool = pool  # optional NodePool that removed nodes go back to
+        self._version = 0  # bumped by every change that moves or unlinks nodes
+        # finger: last node reached by a positional operation, valid for one version
+        self._finger_node = None
+        self._finger_index = 0
+        self._finger_version = -1
+
+    def _changed(self):
+        """
+        Records a structural change: the finger and existing cursors become stale
+        """
+        self._version += 1
+
+    def _node_at(self, index):
+        """
+        Returns the node at a valid index, walking from the finger when it is at or
+        before index (else from head), and moves the finger there
+        """
+        if index == self.n - 1:
+            temp_node = self.tail
+        else:
+            temp_node, pos = self.head, 0
+            if self._finger_version == self._version and self._finger_index <= index:
+                temp_node, pos = self._finger_node, self._finger_index
+            for _ in range(index - pos):
+                temp_node = temp_node.next
+        self._finger_node = temp_node
+        self._finger_index = index
+        self._finger_version = self._version
+        return temp_node
+
+    def cursor(self, index=0):
+        """
+        Returns a ListCursor at index
+        """
+        return ListCursor(self, index)
+
+    def _new_node(self, item):
+        """
+        Returns a node for item, from the pool if there is one
+        """
+        if self.pool is None:
+            return Node(item)
+        return self.pool.get(item)
+
+    def _free_node(self, node):
+        """
+        Hands an unlinked node back to the pool (if any) and returns its value
+        """
+        val = node.val
+        if self.pool is not None:
+            self.pool.put(node)
+        return val
 
     def __len__(self):
         """
@@ -52,46 +189,105 @@ class SLinkedList:
 
     def __str__(self):
         """
-        Print items in the linked list
+        Print items in the linked list (one join, not repeated concatenation)
+        """
+        return ''.join(['head'] + [f' -> {val}' for val in self] + ['-> None'])
+
+    def __iter__(self):
+        """
+        Generator over the values, front to back
         """
-        temp = "head"
         temp_node = self.head
         while temp_node is not None:
-            temp += f' -> {temp_node.val}'
+            yield temp_node.val
             temp_node = temp_node.next
-        temp += f'-> None'
-        return temp
+
+    @classmethod
+    def from_iterable(cls, iterable, pool=None):
+        """
+        Builds a list from the values of iterable
+        """
+        llist = cls(pool=pool)
+        llist.extend(iterable)
+        return llist
+
+    def extend(self, iterable):
+        """
+        Appends every value of iterable: the batch is linked into a chain first,
+        then spliced after the tail in one step
+        """
+        first = last = None
+        count = 0
+        for item in iterable:
+            new_node = self._new_node(item)
+            if first is None:
+                first = new_node
+            else:
+                last.next = new_node
+            last = new_node
+            count += 1
+        if first is None:
+            return
+        if self.head is None:
+            self.head = first
+        else:
+            self.tail.next = first
+        self.tail = last
+        self.n += count
+
+    def to_list(self):
+        """
+        Returns the values as a Python list
+        """
+        return list(self)
+
+    def map(self, fn):
+        """
+        Lazy stage: fn(value) for every value
+        """
+        return ListStream(iter(self)).map(fn)
+
+    def filter(self, predicate):
+        """
+        Lazy stage: the values for which predicate(value) is true
+        """
+        return ListStream(iter(self)).filter(predicate)
+
+    def take(self, k):
+        """
+        Lazy stage: the first k values
+        """
+        return ListStream(iter(self)).take(k)
 
     def push_back(self, item):
         """
         Adds an item at the end of the list.
         """
-        new_node = Node(item)  # first create a node
+        new_node = self._new_node(item)  # first create a node
         # if the list is empty, make it head
         if self.head is None:
             self.head = new_node
         else:
-            # else, travel till the end 
-            temp_node = self.head
-            while temp_node.next is not None:
-                temp_node = temp_node.next
-            # make last node to point to new_node
-            temp_node.next = new_node
+            # else, make the tail node point to new_node
+            self.tail.next = new_node
+        self.tail = new_node
         self.n += 1  # increment no. of items
 
     def push_front(self, item):
         """
         Adds an item at the front of the list.
         """
-        new_node = Node(item)
+        new_node = self._new_node(item)
         # if the list is empty, make it head
         if self.head is None:
             self.head = new_node
+            self.tail = new_node
         # else, 
         else:
             new_node.next = self.head  # new node points to current head
             self.head = new_node  # current head points to new_node
         self.n += 1
+        self._changed()
 
     def pop_front(self):
         """
@@ -103,8 +299,11 @@ class SLinkedList:
         else:
             temp = self.head  # retrieve front node
             self.head = temp.next # assign head to the second node
+            if self.head is None:
+                self.tail = None
             self.n -= 1
-        return temp.val
+            self._changed()
+        return self._free_node(temp)
     
     def pop_back(self):
         """
@@ -113,15 +312,19 @@ class SLinkedList:
         if self.n==0:
             print("Error; empty list")
             return
+        temp = self.tail
+        if self.n==1:
+            self.head = self.tail = None
         else:
             temp_node = self.head
-            # until temp_node is final-1 node
-            while temp_node.next.next is not None:
+            # until temp_node is final-1 node (singly linked: no way back from the tail)
+            while temp_node.next is not temp:
                 temp_node = temp_node.next
-            temp = temp_node.next
             temp_node.next = None  # reset the tail node
-            self.n -= 1 # decrement
-            return temp.val
+            self.tail = temp_node
+        self.n -= 1 # decrement
+        self._changed()
+        return self._free_node(temp)
 
     def front(self):
         """
@@ -139,10 +342,7 @@ class SLinkedList:
         if self.head is None:
             print("Error: empty list!")
             return
-        temp_node = self.head
-        while temp_node.next is not None:
-            temp_node = temp_node.next
-        return temp_node.val
+        return self.tail.val
         
     def is_empty(self):
         """
@@ -154,13 +354,10 @@ class SLinkedList:
         """
         returns the value of the nth item (starting at 0)
         """
-        if index==0:
-            return self.head.val
-
-        temp_node = self.head
-        for _ in range(index):
-            temp_node = temp_node.next
-        return temp_node.val
+        if index < 0 or index >= self.n:
+            print("Index Error; please input valid index")
+            return
+        return self._node_at(index).val
 
     def insert(self, index, value):
         """
@@ -175,21 +372,26 @@ class SLinkedList:
         if index==0:
             self.push_front(value)
             return
+        # if index==n, same as push_back
+        if index==self.n:
+            self.push_back(value)
+            return
         # else,
-        new_node = Node(value)
-        temp_node = self.head
-        for _ in range(index-1):
-            temp_node = temp_node.next  # traverse the list
+        new_node = self._new_node(value)
+        temp_node = self._node_at(index-1)  # traverse the list (from the finger if possible)
         new_node.next = temp_node.next  # temp_node is index-1 node
         temp_node.next =  new_node
         self.n += 1
+        self._changed()
+        # nodes up to index-1 did not move: keep the finger there
+        self._finger_version = self._version
     
     def delete(self, index):
         """
         removes node at given index
         """
         # check validity of index:
-        if index < 0 or index > self.n:
+        if index < 0 or index >= self.n:
             print("Index Error; please input valid index")
             return
         # if head element is to be removed,
@@ -197,14 +399,16 @@ class SLinkedList:
             _ = self.pop_front()
             return
         # else,
-        temp_node = self.head
-        for _ in range(index-1):
-            temp_node = temp_node.next  # traverse the list
+        temp_node = self._node_at(index-1)  # traverse the list (from the finger if possible)
         index_node = temp_node.next
         # unlink
         temp_node.next = temp_node.next.next
-        index_node = None
+        if index_node is self.tail:
+            self.tail = temp_node
+        self._free_node(index_node)
         self.n -= 1
+        self._changed()
+        self._finger_version = self._version  # nodes up to index-1 did not move
     
     def remove_value(self, value):
         """
@@ -212,25 +416,27 @@ class SLinkedList:
         """
         # check the head's key
         temp_node = self.head
-        if temp_node.val==value:
-            self.head = temp_node.next
-            temp_node = None
-            self.n -= 1
+        if temp_node is not None and temp_node.val==value:
+            self.pop_front()
             return
 
         # search for the key value
-        while temp_node.val != value:  # check the next node's key
+        prev_node = None
+        while temp_node is not None and temp_node.val != value:  # check the next node's key
             prev_node = temp_node  # store prev node to change prev.next
             temp_node = temp_node.next
         # if the key is not found
-        if temp_node == None:
+        if temp_node is None:
             print("Error; key value is not found")
             return
         else:
             # reconfigure; unlink the current node
             prev_node.next = temp_node.next
-            temp_node = None
+            if temp_node is self.tail:
+                self.tail = prev_node
+            self._free_node(temp_node)
             self.n -= 1
+            self._changed()
 
     def value_n_from_end(self, n):
         """
@@ -241,10 +447,7 @@ class SLinkedList:
             print(f"Error; n is greater than the length of the list = {self.n-1}") 
             return
         
-        temp_node = self.head  # store head
-        for _ in range((self.n-1) - n):
-            temp_node = temp_node.next  # traverse the list
-        return temp_node.val
+        return self._node_at((self.n-1) - n).val
 
     def reverse(self):
         """
@@ -260,12 +463,14 @@ class SLinkedList:
         # else,
         prev_node = None  # tail should be none
         cur_node = self.head
+        self.tail = cur_node  # old head becomes the tail
         while cur_node is not None:
             next_node = cur_node.next
             cur_node.next = prev_node
             prev_node = cur_node
             cur_node = next_node
         self.head = prev_node
+        self._changed()
 
     def delete_list(self):
         """
@@ -279,6 +484,459 @@ class SLinkedList:
             # reset data
             prev_node.val = None
             prev_node.next = None
+            self._free_node(prev_node)
+        self.head = None
+        self.tail = None
+        self.n = 0
+        self._changed()
+
+    def sort(self, key=None):
+        """
+        Stable in-place merge sort, bottom-up: pass after pass, merges the sorted
+        runs of width 1, 2, 4, ... pairwise by relinking their nodes
+        """
+        if self.n < 2:
+            return
+        dummy = Node()  # points at the front while the runs are relinked
+        dummy.next = self.head
+        width = 1
+        while width < self.n:
+            tail = dummy
+            cur_node = dummy.next
+            while cur_node is not None:
+                left = cur_node
+                right = _split_after(left, width)
+                cur_node = _split_after(right, width)
+                tail = _merge_runs(left, right, tail, key)
+            width *= 2
+        self.head = dummy.next
+        self.tail = tail
+        self._changed()
+
+    def merge_sorted(self, other, key=None):
+        """
+        Merges the sorted list other into this sorted list (stable: on ties
+        this list's values come first); other is left empty
+        """
+        if other.head is None:
+            return
+        dummy = Node()
+        tail = _merge_runs(self.head, other.head, dummy, key)
+        self.head = dummy.next
+        self.tail = tail
+        self.n += other.n
+        other.head = other.tail = None
+        other.n = 0
+        self._changed()
+        other._changed()
+
+def _split_after(node, k):
+    """
+    Cuts the chain starting at node after k nodes; returns the rest (or None)
+    """
+    for _ in range(k - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+    rest = node.next
+    node.next = None
+    return rest
+
+def _merge_runs(left, right, tail, key):
+    """
+    Links the sorted chains left and right, merged (left first on ties), after tail;
+    returns the last node
+    """
+    while left is not None and right is not None:
+        if key is None:
+            take_right = right.val < left.val
+        else:
+            take_right = key(right.val) < key(left.val)
+        if take_right:
+            tail.next = right
+            right = right.next
+        else:
+            tail.next = left
+            left = left.next
+        tail = tail.next
+    tail.next = left if left is not None else right
+    while tail.next is not None:
+        tail = tail.next
+    return tail
+
+def merge_k_sorted(lists, key=None):
+    """
+    Returns one sorted SLinkedList holding the nodes of the sorted lists
+    (stable: ties keep the order of lists); the inputs are left empty
+    """
+    lists = list(lists)  # walked twice: to seed the heap, then to empty the inputs
+    heap = []  # (sort key, list number, node): the list number breaks ties
+    for i, llist in enumerate(lists):
+        if llist.head is not None:
+            node = llist.head
+            heap.append((node.val if key is None else key(node.val), i, node))
+    heapq.heapify(heap)
+    merged = SLinkedList()
+    dummy = tail = Node()
+    while heap:
+        _, i, node = heap[0]
+        if node.next is None:
+            heapq.heappop(heap)
+        else:
+            nxt = node.next
+            heapq.heapreplace(heap, (nxt.val if key is None else key(nxt.val), i, nxt))
+        tail.next = node
+        tail = node
+    tail.next = None
+    merged.head = dummy.next
+    merged.tail = tail if merged.head is not None else None
+    for llist in lists:
+        merged.n += llist.n
+        llist.head = llist.tail = None
+        llist.n = 0
+        llist._changed()
+    return merged
+
+class ListCursor:
+    """
+    Position in an SLinkedList: node + index. Moving forward walks from the
+    cursor's node; insert_after/remove_after edit next to it in O(1) and keep the
+    cursor valid. Any other structural change of the list invalidates it.
+    """
+    def __init__(self, llist, index=0):
+        self.llist = llist
+        self.version = llist._version
+        self.node = None
+        self.index = -1  # before the first node
+        self.seek(index)
+
+    def _check(self):
+        if self.version != self.llist._version:
+            raise RuntimeError("SLinkedList changed: cursor invalidated")
+
+    @property
+    def value(self):
+        """
+        Value at the cursor
+        """
+        self._check()
+        return self.node.val
+
+    @value.setter
+    def value(self, val):
+        self._check()
+        self.node.val = val
+
+    def seek(self, index):
+        """
+        Moves to index: forward from the cursor, or from head if index is behind it
+        """
+        self._check()
+        if index < 0 or index >= self.llist.n:
+            raise IndexError("cursor index out of range")
+        if self.node is None or index < self.index:
+            self.node, self.index = self.llist.head, 0
+        for _ in range(index - self.index):
+            self.node = self.node.next
+        self.index = index
+        return self
+
+    def advance(self, k=1):
+        """
+        Moves k nodes forward
+        """
+        return self.seek(self.index + k)
+
+    def insert_after(self, value):
+        """
+        Links value right after the cursor
+        """
+        self._check()
+        llist = self.llist
+        new_node = llist._new_node(value)
+        new_node.next = self.node.next
+        self.node.next = new_node
+        if self.node is llist.tail:
+            llist.tail = new_node
+        llist.n += 1
+        llist._changed()
+        self.version = llist._version
+
+    def remove_after(self):
+        """
+        Unlinks the node after the cursor and returns its value
+        """
+        self._check()
+        llist = self.llist
+        index_node = self.node.next
+        if index_node is None:
+            raise IndexError("no node after the cursor")
+        self.node.next = index_node.next
+        if index_node is llist.tail:
+            llist.tail = self.node
+        llist.n -= 1
+        llist._changed()
+        self.version = llist._version
+        return llist._free_node(index_node)
+
+class ListStream:
+    """
+    Lazy pipeline over a list's values (or any iterator): every stage wraps the
+    previous generator, so values are produced one at a time on demand
+    """
+    def __init__(self, source):
+        self.source = source
+
+    def __iter__(self):
+        return iter(self.source)
+
+    def map(self, fn):
+        """
+        Stage: fn(value) for every value
+        """
+        return ListStream(map(fn, self.source))
+
+    def filter(self, predicate):
+        """
+        Stage: the values for which predicate(value) is true
+        """
+        return ListStream(filter(predicate, self.source))
+
+    def take(self, k):
+        """
+        Stage: the first k values (stops reading the list after them)
+        """
+        return ListStream(itertools.islice(self.source, k))
+
+    def to_list(self):
+        """
+        Runs the pipeline into a Python list
+        """
+        return list(self.source)
+
+    def to_linked_list(self, pool=None):
+        """
+        Runs the pipeline into a new SLinkedList
+        """
+        return SLinkedList.from_iterable(self.source, pool=pool)
+
+class DNode:
+    """
+    Node class for doubly linked list
+    val = key value
+    prev, next = pointers to the previous / next node
+    """
+    __slots__ = ('val', 'prev', 'next')
+
+    def __init__(self, val=None):
+        self.val = val
+        self.prev = None
+        self.next = None
+
+class DLinkedList:
+    """
+    Doubly Linked List in Python, circular around a sentinel node:
+    sentinel.next is the front, sentinel.prev the back, and an empty list
+    is the sentinel pointing at itself, so no operation special-cases
+    the ends or the empty list
+    pool = optional NodePool(DNode) (a pool of other nodes raises TypeError); with a
+    pool, do not keep using a node handle after its item is removed (the node is recycled)
+    """
+    def __init__(self, pool=None):
+        if pool is not None and not issubclass(pool.node_type, DNode):
+            raise TypeError("DLinkedList needs a NodePool(DNode)")
+        self.sentinel = DNode()
+        self.sentinel.prev = self.sentinel.next = self.sentinel
+        self.n = 0
+        self.pool = pool
+
+    def __len__(self):
+        """
+        Return the number of elements in the list
+        """
+        return self.n
+
+    def __str__(self):
+        """
+        Print items in the linked list
+        """
+        vals = []
+        temp_node = self.sentinel.next
+        while temp_node is not self.sentinel:
+            vals.append(f'{temp_node.val}')
+            temp_node = temp_node.next
+        return ' <-> '.join(['head'] + vals + ['None'])
+
+    def _link_after(self, node, item):
+        """
+        Links a new node holding item right after node and returns it
+        """
+        new_node = DNode(item) if self.pool is None else self.pool.get(item)
+        new_node.prev = node
+        new_node.next = node.next
+        node.next.prev = new_node
+        node.next = new_node
+        self.n += 1
+        return new_node
+
+    def _node_at(self, index):
+        """
+        Returns the node at index, walking from the nearer end
+        """
+        if index < self.n // 2:
+            temp_node = self.sentinel.next
+            for _ in range(index):
+                temp_node = temp_node.next
+        else:
+            temp_node = self.sentinel.prev
+            for _ in range(self.n - 1 - index):
+                temp_node = temp_node.prev
+        return temp_node
+
+    def push_front(self, item):
+        """
+        Adds an item at the front of the list; returns its node
+        """
+        return self._link_after(self.sentinel, item)
+
+    def push_back(self, item):
+        """
+        Adds an item at the end of the list; returns its node
+        """
+        return self._link_after(self.sentinel.prev, item)
+
+    def remove_node(self, node):
+        """
+        Unlinks a node of this list (e.g. one returned by push_back) and returns its value
+        """
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = node.next = None
+        self.n -= 1
+        val = node.val
+        if self.pool is not None:
+            self.pool.put(node)
+        return val
+
+    def pop_front(self):
+        """
+        Remove front item and return its value
+        """
+        if self.n==0:
+            print("Error; empty list")
+            return
+        return self.remove_node(self.sentinel.next)
+
+    def pop_back(self):
+        """
+        Remove item from the back and return its value
+        """
+        if self.n==0:
+            print("Error; empty list")
+            return
+        return self.remove_node(self.sentinel.prev)
+
+    def front(self):
+        """
+        Returns front item
+        """
+        if self.n==0:
+            print("Error: empty list!")
+            return
+        return self.sentinel.next.val
+
+    def back(self):
+        """
+        Returns back item
+        """
+        if self.n==0:
+            print("Error: empty list!")
+            return
+        return self.sentinel.prev.val
+
+    def is_empty(self):
+        """
+        Returns true if the list is empty
+        """
+        return self.n==0
+
+    def value_at(self, index):
+        """
+        returns the value of the nth item (starting at 0)
+        """
+        if index < 0 or index >= self.n:
+            print("Index Error; please input valid index")
+            return
+        return self._node_at(index).val
+
+    def insert(self, index, value):
+        """
+        insert value at index, 
+        so current item at that index is pointed to by new item at index;
+        returns the new node
+        """
+        if index < 0 or index > self.n:
+            print("Index Error; please input valid index")
+            return
+        prev_node = self.sentinel if index == 0 else self._node_at(index - 1)
+        return self._link_after(prev_node, value)
+
+    def delete(self, index):
+        """
+        removes node at given index
+        """
+        if index < 0 or index >= self.n:
+            print("Index Error; please input valid index")
+            return
+        self.remove_node(self._node_at(index))
+
+    def remove_value(self, value):
+        """
+        removes the first item in the list with this value
+        """
+        temp_node = self.sentinel.next
+        while temp_node is not self.sentinel:
+            if temp_node.val == value:
+                self.remove_node(temp_node)
+                return
+            temp_node = temp_node.next
+        print("Error; key value is not found")
+
+    def value_n_from_end(self, n):
+        """
+        returns the value of the node at nth position from the end of the list
+        """
+        if n < 0 or n > self.n-1:
+            print(f"Error; n is greater than the length of the list = {self.n-1}")
+            return
+        return self._node_at(self.n - 1 - n).val
+
+    def reverse(self):
+        """
+        reverse the list (swaps prev/next of every node, sentinel included)
+        """
+        temp_node = self.sentinel
+        while True:
+            temp_node.prev, temp_node.next = temp_node.next, temp_node.prev
+            temp_node = temp_node.prev  # the old next
+            if temp_node is self.sentinel:
+                break
+
+    def delete_list(self):
+        """
+        Delete the entire linked list
+        """
+        temp_node = self.sentinel.next
+        while temp_node is not self.sentinel:
+            next_node = temp_node.next
+            temp_node.val = temp_node.prev = temp_node.next = None
+            if self.pool is not None:
+                self.pool.put(temp_node)
+            temp_node = next_node
+        self.sentinel.prev = self.sentinel.next = self.sentinel
+        self.n = 0
 
 if __name__=="__main__":
     llist = SLinkedList()
@@ -416,4 +1074,122 @@ if __name__=="__main__":
     llist.delete_list()
     print("\nDelete the list!")
     print(f"No. of items = {llist.n}")
-    print(f"Linked list = {llist}")
\ No newline at end of file
+    print(f"Linked list = {llist}")
+
+    ############## DLinkedList: O(1) at both ends and for a known node ################
+    dlist = DLinkedList()
+    for day in ("Mon", "Tue", "Wed"):
+        dlist.push_back(day)
+    sun = dlist.push_front("Sun")
+    print(f"\nDLinkedList = {dlist}")
+    dlist.remove_node(sun)
+    print(f"remove_node(Sun) -> {dlist}, pop_back = {dlist.pop_back()}")
+    dlist.reverse()
+    print(f"reversed = {dlist}")
+
+    ############## Benchmark: push/pop at both ends vs collections.deque ################
+    import time
+    from collections import deque
+    n = 200000
+    print(f"\n{n} x push_back + pop_front + push_front + pop_back (seconds)")
+    for name, make in (("SLinkedList", SLinkedList), ("DLinkedList", DLinkedList), ("deque", deque)):
+        container = make()
+        push_back = getattr(container, "push_back", getattr(container, "append", None))
+        push_front = getattr(container, "push_front", getattr(container, "appendleft", None))
+        pop_front = getattr(container, "pop_front", getattr(container, "popleft", None))
+        pop_back = getattr(container, "pop_back", getattr(container, "pop", None))
+        start = time.perf_counter()
+        for i in range(n):
+            push_back(i)
+        for i in range(n):
+            pop_front()
+        for i in range(n):
+            push_front(i)
+        if name == "SLinkedList":
+            pop_back = pop_front  # pop_back is O(n) on a singly linked list
+        for i in range(n):
+            pop_back()
+        print(f"{name:<12} {time.perf_counter() - start:.3f}")
+
+    ############## Benchmark: slotted nodes and node pooling ################
+    import tracemalloc
+
+    class DictNode:
+        """
+        Node without __slots__, for comparison
+        """
+        def __init__(self, val=None):
+            self.val = val
+            self.next = None
+
+    n = 1000000
+    print(f"\nmemory of {n} nodes (bytes per node)")
+    for node_type in (DictNode, Node):
+        tracemalloc.start()
+        head = None
+        for i in range(n):
+            node = node_type(i)
+            node.next = head
+            head = node
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del head, node
+        print(f"{node_type.__name__:<9} {size / n:.0f}")
+
+    print(f"\nchurn: {n} x (push_back, pop_front) on a 1000-element list (seconds)")
+    for pool in (None, NodePool()):
+        llist = SLinkedList(pool=pool)
+        for i in range(1000):
+            llist.push_back(i)
+        start = time.perf_counter()
+        for i in range(n):
+            llist.push_back(i)
+            llist.pop_front()
+        elapsed = time.perf_counter() - start
+        extra = "" if pool is None else f", allocated = {pool.allocated}, reused = {pool.reused}"
+        print(f"pool={pool is not None!s:<5} {elapsed:.3f}{extra}")
+
+    ############## Streaming pipeline over a long list ################
+    n = 1000000
+    llist = SLinkedList.from_iterable(range(n))
+    start = time.perf_counter()
+    tracemalloc.start()
+    total = sum(llist.map(lambda x: x * x).filter(lambda x: x % 3 == 0))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"\nsum of squares divisible by 3 over {n} nodes = {total}, "
+          f"peak extra memory = {peak} bytes, {time.perf_counter() - start:.3f}s")
+    print(f"first 5 odd values = {llist.filter(lambda x: x % 2).take(5).to_list()}")
+    start = time.perf_counter()
+    text = str(llist)
+    print(f"str() of {n} nodes: {len(text)} chars in {time.perf_counter() - start:.3f}s")
+
+    ############## Sorting and merging sorted runs in place ################
+    import random
+    rng = random.Random(0)
+    n = 200000
+    llist = SLinkedList.from_iterable(rng.random() for _ in range(n))
+    start = time.perf_counter()
+    llist.sort()
+    print(f"\nsort() of {n} nodes: {time.perf_counter() - start:.3f}s")
+    runs = [SLinkedList.from_iterable(sorted(rng.random() for _ in range(n // 200)))
+            for _ in range(200)]
+    start = time.perf_counter()
+    merged = merge_k_sorted(runs)
+    print(f"merge_k_sorted of {len(runs)} runs -> {len(merged)} nodes: {time.perf_counter() - start:.3f}s")
+
+    ############## Sequential positional access: finger vs walking from head ################
+    n = 5000
+    llist = SLinkedList.from_iterable(range(n))
+    start = time.perf_counter()
+    for i in range(n):
+        llist.value_at(i)
+    print(f"\nvalue_at(0..{n - 1}) with the finger: {time.perf_counter() - start:.4f}s")
+    start = time.perf_counter()
+    for i in range(n):
+        llist._finger_version = -1  # forget the finger: every call walks from head
+        llist.value_at(i)
+    print(f"value_at(0..{n - 1}) from head:        {time.perf_counter() - start:.4f}s")
+    cur = llist.cursor(10)
+    cur.insert_after("new")
+    print(f"cursor at 10 -> {cur.value}, after insert_after: {cur.advance().value}")
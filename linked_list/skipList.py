@@ -0,0 +1,291 @@
+"""
+Skip List Reference: https://en.wikipedia.org/wiki/Skip_list#Indexable_skiplist
+
+Indexable Skip List Definition: linked list with extra "express lane" levels.
+Every node is on level 0; a node is also on level i+1 with probability 1/2, so each
+level skips ~2x as many nodes as the one below. Every link stores its width, the
+number of positions it jumps, which turns a search by position into a walk that
+goes as far right as possible on the top level, then drops a level:
+
+   level 2: head ---------------------4------------------> [e] -> None
+   level 1: head ------2------> [b] ------2-----> [d] -1-> [e] -> None
+   level 0: head -1-> [a] -1-> [b] -1-> [c] -1-> [d] -1-> [e] -> None
+
+Key Attributes:
+- Same positional API as SLinkedList: push_front, push_back, pop_front, pop_back,
+  front, back, value_at, insert, delete, remove_value, value_n_from_end, reverse
+- select(k) = k-th value; for a list kept in sorted order with add(value),
+  rank(value) = number of values < value (so add/rank/select make an order-statistic list)
+- seed makes the node levels, and so the timings, reproducible
+
+Time (expected)
+O(log n) value_at, insert, delete, push/pop at either end, select, add, rank
+O(n) remove_value, reverse
+"""
+import random
+
+MAX_LEVEL = 32  # enough for 2**32 items
+
+class SkipNode:
+    """
+    Skip list node: next[i] / width[i] = next node on level i and how many positions it is away
+    (a link to None is as wide as the distance to the end of the list)
+    """
+    __slots__ = ('val', 'next', 'width')
+
+    def __init__(self, val=None, level=1):
+        self.val = val
+        self.next = [None] * level
+        self.width = [1] * level
+
+class SkipList:
+    """
+    Indexable skip list
+    """
+    def __init__(self, seed=None):
+        self.head = SkipNode(level=MAX_LEVEL)  # sentinel at position -1
+        self.level = 1  # levels in use
+        self.n = 0
+        self._random = random.Random(seed)
+
+    def __len__(self):
+        """
+        Return the number of elements in the list
+        """
+        return self.n
+
+    def __str__(self):
+        """
+        Print items in the linked list
+        """
+        vals = []
+        temp_node = self.head.next[0]
+        while temp_node is not None:
+            vals.append(f'{temp_node.val}')
+            temp_node = temp_node.next[0]
+        return ''.join(['head'] + [f' -> {val}' for val in vals] + ['-> None'])
+
+    def is_empty(self):
+        """
+        Returns true if the list is empty
+        """
+        return self.n==0
+
+    def _random_level(self):
+        """
+        Level of a new node: 1 + number of heads in a row of fair coin flips
+        """
+        level = 1
+        while level < MAX_LEVEL and self._random.random() < 0.5:
+            level += 1
+        return level
+
+    def value_at(self, index):
+        """
+        returns the value of the nth item (starting at 0)
+        """
+        if index < 0 or index >= self.n:
+            print("Index Error; please input valid index")
+            return
+        node, pos = self.head, -1
+        for lvl in reversed(range(self.level)):
+            while node.next[lvl] is not None and pos + node.width[lvl] <= index:
+                pos += node.width[lvl]
+                node = node.next[lvl]
+        return node.val
+
+    select = value_at
+
+    def insert(self, index, value):
+        """
+        insert value at index,
+        so current item at that index is pointed to by new item at index
+        """
+        if index < 0 or index > self.n:
+            print("Index Error; please input valid index")
+            return
+        level = self._random_level()
+        for lvl in range(self.level, level):
+            self.head.width[lvl] = self.n + 1  # a new top level: head links straight to the end
+        self.level = max(self.level, level)
+        new_node = SkipNode(value, level)
+        node, pos = self.head, -1
+        for lvl in reversed(range(self.level)):
+            # rightmost node on this level before index
+            while node.next[lvl] is not None and pos + node.width[lvl] < index:
+                pos += node.width[lvl]
+                node = node.next[lvl]
+            if lvl < level:
+                new_node.next[lvl] = node.next[lvl]
+                node.next[lvl] = new_node
+                new_node.width[lvl] = node.width[lvl] - (index - pos) + 1
+                node.width[lvl] = index - pos
+            else:
+                node.width[lvl] += 1  # the link now jumps over the new node too
+        self.n += 1
+
+    def delete(self, index):
+        """
+        removes node at given index and returns its value
+        """
+        if index < 0 or index >= self.n:
+            print("Index Error; please input valid index")
+            return
+        node, pos = self.head, -1
+        target = None
+        for lvl in reversed(range(self.level)):
+            while node.next[lvl] is not None and pos + node.width[lvl] < index:
+                pos += node.width[lvl]
+                node = node.next[lvl]
+            next_node = node.next[lvl]
+            if next_node is not None and pos + node.width[lvl] == index:
+                # unlink the target on this level
+                node.width[lvl] += next_node.width[lvl] - 1
+                node.next[lvl] = next_node.next[lvl]
+                target = next_node
+            else:
+                node.width[lvl] -= 1
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        self.n -= 1
+        return target.val
+
+    def push_front(self, item):
+        """
+        Adds an item at the front of the list
+        """
+        self.insert(0, item)
+
+    def push_back(self, item):
+        """
+        Adds an item at the end of the list
+        """
+        self.insert(self.n, item)
+
+    def pop_front(self):
+        """
+        Remove front item and return its value
+        """
+        if self.n==0:
+            print("Error; empty list")
+            return
+        return self.delete(0)
+
+    def pop_back(self):
+        """
+        Remove item from the back and return its value
+        """
+        if self.n==0:
+            print("Error; empty list")
+            return
+        return self.delete(self.n - 1)
+
+    def front(self):
+        """
+        Returns front item
+        """
+        if self.n==0:
+            print("Error: empty list!")
+            return
+        return self.head.next[0].val
+
+    def back(self):
+        """
+        Returns back item
+        """
+        if self.n==0:
+            print("Error: empty list!")
+            return
+        return self.value_at(self.n - 1)
+
+    def value_n_from_end(self, n):
+        """
+        returns the value of the node at nth position from the end of the list
+        """
+        if n < 0 or n > self.n-1:
+            print(f"Error; n is greater than the length of the list = {self.n-1}")
+            return
+        return self.value_at(self.n - 1 - n)
+
+    def remove_value(self, value):
+        """
+        removes the first item in the list with this value
+        """
+        temp_node, index = self.head.next[0], 0
+        while temp_node is not None:
+            if temp_node.val == value:
+                self.delete(index)
+                return
+            temp_node, index = temp_node.next[0], index + 1
+        print("Error; key value is not found")
+
+    def reverse(self):
+        """
+        reverse the list (rebuilt from the values in reverse order)
+        """
+        vals = []
+        temp_node = self.head.next[0]
+        while temp_node is not None:
+            vals.append(temp_node.val)
+            temp_node = temp_node.next[0]
+        self.head = SkipNode(level=MAX_LEVEL)
+        self.level = 1
+        self.n = 0
+        for val in reversed(vals):
+            self.push_back(val)
+
+    def rank(self, value):
+        """
+        Number of values smaller than value (the list must be in sorted order)
+        """
+        node, pos = self.head, -1
+        for lvl in reversed(range(self.level)):
+            while node.next[lvl] is not None and node.next[lvl].val < value:
+                pos += node.width[lvl]
+                node = node.next[lvl]
+        return pos + 1
+
+    def add(self, value):
+        """
+        Inserts value after any equal values, keeping a sorted list sorted
+        """
+        node, pos = self.head, -1
+        for lvl in reversed(range(self.level)):
+            while node.next[lvl] is not None and not value < node.next[lvl].val:
+                pos += node.width[lvl]
+                node = node.next[lvl]
+        self.insert(pos + 1, value)
+
+if __name__=="__main__":
+    import time
+    from linkedList import SLinkedList
+
+    slist = SkipList(seed=1)
+    for day in ("Mon", "Tue", "Wed", "Thurs"):
+        slist.push_back(day)
+    slist.insert(0, "Sun")
+    print(slist)
+    print(f"value_at(2) = {slist.value_at(2)}, delete(1) = {slist.delete(1)} -> {slist}")
+
+    scores = SkipList(seed=1)
+    for score in (70, 90, 50, 80, 60):
+        scores.add(score)
+    print(f"\nsorted = {scores}, rank(75) = {scores.rank(75)}, select(0) = {scores.select(0)}")
+
+    ############## Benchmark vs SLinkedList: random positional edits ################
+    n = 20000
+    rng = random.Random(0)
+    ops = [(rng.random() < 0.5, rng.random()) for _ in range(n)]
+    print(f"\n{n} random insert/delete + value_at at random positions (seconds)")
+    for llist in (SLinkedList(), SkipList(seed=0)):
+        for i in range(n):
+            llist.push_back(i)
+        start = time.perf_counter()
+        for is_insert, where in ops:
+            index = int(where * len(llist))
+            if is_insert:
+                llist.insert(index, -1)
+            else:
+                llist.delete(index)
+            llist.value_at(int(where * (len(llist) - 1)))
+        print(f"{type(llist).__name__:<12} {time.perf_counter() - start:.3f}")
@@ -0,0 +1,320 @@
+"""
+Unrolled Linked List Reference: https://en.wikipedia.org/wiki/Unrolled_linked_list
+
+Unrolled Linked List Definition: singly linked list whose nodes each hold a small
+array of up to node_capacity values instead of a single value
+
+   head -> [v0 v1 v2 v3] -> [v4 v5 v6] -> [v7 v8 v9 v10] -> None
+
+Key Attributes:
+- n / B node objects instead of n for capacity B, so far fewer objects and pointer
+  hops: a walk skips a whole node by its length and scans values from one array
+- A node that overflows on insert is split in two halves, a node that drops below
+  half full on delete borrows values from its successor or is merged into it
+  (push_front/push_back start a new one-value node once the end node is full)
+- Same API as SLinkedList: push_front, push_back, pop_front, pop_back, front, back,
+  value_at, insert, delete, remove_value, value_n_from_end, reverse
+
+Time (B = node_capacity)
+O(1) push_back, front, back
+O(B) push_front, pop_front (the values in the head node's array shift by one)
+O(n/B + B) value_at, insert, delete, value_n_from_end, pop_back
+O(n) reverse, remove_value
+"""
+class UNode:
+    """
+    Unrolled list node: vals = list of up to node_capacity values, next = next node
+    """
+    __slots__ = ('vals', 'next')
+
+    def __init__(self, vals=None):
+        self.vals = [] if vals is None else vals
+        self.next = None
+
+class UnrolledLinkedList:
+    """
+    Singly linked list of small value arrays
+    """
+    def __init__(self, node_capacity=64):
+        if node_capacity < 2:
+            raise ValueError("node_capacity must be at least 2")
+        self.node_capacity = node_capacity
+        self.head = None
+        self.tail = None
+        self.n = 0
+        self.n_nodes = 0
+
+    def __len__(self):
+        """
+        Return the number of elements in the list
+        """
+        return self.n
+
+    def __str__(self):
+        """
+        Print items in the linked list, one [..] group per node
+        """
+        groups = []
+        temp_node = self.head
+        while temp_node is not None:
+            groups.append(' '.join(map(str, temp_node.vals)))
+            temp_node = temp_node.next
+        return ''.join(['head'] + [f' -> [{group}]' for group in groups] + ['-> None'])
+
+    def is_empty(self):
+        """
+        Returns true if the list is empty
+        """
+        return self.n==0
+
+    def push_front(self, item):
+        """
+        Adds an item at the front of the list
+        """
+        if self.head is None or len(self.head.vals) == self.node_capacity:
+            new_node = UNode([item])
+            new_node.next = self.head
+            self.head = new_node
+            if self.tail is None:
+                self.tail = new_node
+            self.n_nodes += 1
+        else:
+            self.head.vals.insert(0, item)
+        self.n += 1
+
+    def push_back(self, item):
+        """
+        Adds an item at the end of the list
+        """
+        if self.tail is None or len(self.tail.vals) == self.node_capacity:
+            self._link_after(self.tail, UNode([item]))
+        else:
+            self.tail.vals.append(item)
+        self.n += 1
+
+    def pop_front(self):
+        """
+        Remove front item and return its value
+        """
+        if self.n==0:
+            print("Error; empty list")
+            return
+        val = self.head.vals.pop(0)
+        self.n -= 1
+        self._rebalance(None, self.head)
+        return val
+
+    def pop_back(self):
+        """
+        Remove item from the back and return its value
+        """
+        if self.n==0:
+            print("Error; empty list")
+            return
+        prev_node, node, _ = self._locate(self.n - 1)
+        val = node.vals.pop()
+        self.n -= 1
+        self._rebalance(prev_node, node)
+        return val
+
+    def front(self):
+        """
+        Returns front item
+        """
+        if self.n==0:
+            print("Error: empty list!")
+            return
+        return self.head.vals[0]
+
+    def back(self):
+        """
+        Returns back item
+        """
+        if self.n==0:
+            print("Error: empty list!")
+            return
+        return self.tail.vals[-1]
+
+    def value_at(self, index):
+        """
+        returns the value of the nth item (starting at 0)
+        """
+        if index < 0 or index >= self.n:
+            print("Index Error; please input valid index")
+            return
+        _, node, j = self._locate(index)
+        return node.vals[j]
+
+    def insert(self, index, value):
+        """
+        insert value at index,
+        so current item at that index is pointed to by new item at index
+        """
+        if index < 0 or index > self.n:
+            print("Index Error; please input valid index")
+            return
+        if index == self.n:
+            self.push_back(value)
+            return
+        _, node, j = self._locate(index)
+        if len(node.vals) == self.node_capacity:
+            # split the full node: its second half moves into a new node after it
+            half = self.node_capacity // 2
+            self._link_after(node, UNode(node.vals[half:]))
+            del node.vals[half:]
+            if j > half:
+                node, j = node.next, j - half
+        node.vals.insert(j, value)
+        self.n += 1
+
+    def delete(self, index):
+        """
+        removes node at given index
+        """
+        if index < 0 or index >= self.n:
+            print("Index Error; please input valid index")
+            return
+        prev_node, node, j = self._locate(index)
+        del node.vals[j]
+        self.n -= 1
+        self._rebalance(prev_node, node)
+
+    def remove_value(self, value):
+        """
+        removes the first item in the list with this value
+        """
+        prev_node, node = None, self.head
+        while node is not None:
+            if value in node.vals:
+                node.vals.remove(value)
+                self.n -= 1
+                self._rebalance(prev_node, node)
+                return
+            prev_node, node = node, node.next
+        print("Error; key value is not found")
+
+    def value_n_from_end(self, n):
+        """
+        returns the value of the node at nth position from the end of the list
+        """
+        if n < 0 or n > self.n-1:
+            print(f"Error; n is greater than the length of the list = {self.n-1}")
+            return
+        return self.value_at(self.n - 1 - n)
+
+    def reverse(self):
+        """
+        reverse the list: the node order and the values inside every node
+        """
+        prev_node = None
+        cur_node = self.head
+        self.tail = cur_node
+        while cur_node is not None:
+            cur_node.vals.reverse()
+            next_node = cur_node.next
+            cur_node.next = prev_node
+            prev_node = cur_node
+            cur_node = next_node
+        self.head = prev_node
+
+    def _locate(self, index):
+        """
+        Returns (previous node, node, offset in node) of the item at index
+        """
+        prev_node, node = None, self.head
+        while index >= len(node.vals):
+            index -= len(node.vals)
+            prev_node, node = node, node.next
+        return prev_node, node, index
+
+    def _link_after(self, node, new_node):
+        """
+        Links new_node after node (at the front if node is None)
+        """
+        if node is None:
+            new_node.next = self.head
+            self.head = new_node
+        else:
+            new_node.next = node.next
+            node.next = new_node
+        if new_node.next is None:
+            self.tail = new_node
+        self.n_nodes += 1
+
+    def _rebalance(self, prev_node, node):
+        """
+        After a removal from node: unlink it if empty, else refill it from its
+        successor (merge both if they fit in one node) once it is under half full
+        """
+        if not node.vals:
+            if prev_node is None:
+                self.head = node.next
+            else:
+                prev_node.next = node.next
+            if node is self.tail:
+                self.tail = prev_node
+            node.next = None
+            self.n_nodes -= 1
+            return
+        next_node = node.next
+        if next_node is None or len(node.vals) >= self.node_capacity // 2:
+            return
+        if len(node.vals) + len(next_node.vals) <= self.node_capacity:
+            node.vals.extend(next_node.vals)
+            node.next = next_node.next
+            if next_node is self.tail:
+                self.tail = node
+            self.n_nodes -= 1
+        else:
+            k = (len(next_node.vals) - len(node.vals)) // 2
+            node.vals.extend(next_node.vals[:k])
+            del next_node.vals[:k]
+
+if __name__=="__main__":
+    import time
+    from linkedList import SLinkedList
+
+    ulist = UnrolledLinkedList(node_capacity=4)
+    for day in ("Mon", "Tue", "Wed", "Thurs", "Fri"):
+        ulist.push_back(day)
+    ulist.push_front("Sun")
+    print(ulist)
+    ulist.insert(2, "Holiday")
+    print(f"insert(2, Holiday) -> {ulist}")
+    ulist.delete(0)
+    ulist.delete(0)
+    print(f"delete(0) x2 -> {ulist}")
+    ulist.reverse()
+    print(f"reversed -> {ulist}, value_at(1) = {ulist.value_at(1)}")
+
+    ############## Benchmark vs SLinkedList ################
+    # SLinkedList resumes from its finger and returns the tail directly: park the finger
+    # at the head with value_at(0) (O(1) for both lists) before every call and stay off
+    # the last index, so each call really walks
+    import random
+    n = 200000
+    rng = random.Random(0)
+    positions = [rng.randrange(n // 4, 3 * n // 4) for _ in range(100)]
+    lists = (SLinkedList(), UnrolledLinkedList())
+    for llist in lists:
+        for i in range(n):
+            llist.push_back(i)
+    print(f"\nn = {n} (seconds)")
+    for llist in lists:
+        start = time.perf_counter()
+        for _ in range(10):
+            llist.value_at(0)
+            llist.value_at(n - 2)  # walks the whole list
+        traversal = time.perf_counter() - start
+        start = time.perf_counter()
+        for index in positions:
+            llist.value_at(0)
+            llist.value_at(index)
+        lookups = time.perf_counter() - start
+        start = time.perf_counter()
+        for i, index in enumerate(positions):
+            llist.value_at(0)
+            llist.insert(index, i)
+        inserts = time.perf_counter() - start
+        print(f"{type(llist).__name__:<20} value_at(n-2) x10={traversal:.3f} "
+              f"value_at(random middle) x100={lookups:.3f} insert(random middle) x100={inserts:.3f}")